@@ -92,7 +92,7 @@ AGENT_HANDLERS = {
 }
 
 
-def execute_agent(agent_name: str, user_message: str, conversation_history=None):
+def execute_agent(agent_name: str, user_message: str, conversation_history=None, **kwargs):
     """
     Convenience function to execute an agent by name.
 
@@ -100,6 +100,8 @@ def execute_agent(agent_name: str, user_message: str, conversation_history=None)
         agent_name: Name of agent ("orthopedic", "cardiology", "primary_care")
         user_message: User's message
         conversation_history: Optional conversation history
+        **kwargs: Extra handler-specific arguments (e.g. precomputed_rag
+                 for the orthopedic agent)
 
     Returns:
         Agent execution result
@@ -114,7 +116,7 @@ def execute_agent(agent_name: str, user_message: str, conversation_history=None)
     if handler is None:
         raise ValueError(f"Agent '{agent_name}' is not yet implemented")
 
-    return handler(user_message, conversation_history)
+    return handler(user_message, conversation_history, **kwargs)
 
 
 def route_and_execute(user_message: str, conversation_history=None):
@@ -146,9 +148,13 @@ def route_and_execute(user_message: str, conversation_history=None):
 
     agent_name = routing['agent']
 
-    # Execute the appropriate agent
+    # Execute the appropriate agent, forwarding the router's retrieval so
+    # agents that accept it skip a duplicate vector-store query
     try:
-        agent_result = execute_agent(agent_name, user_message, conversation_history)
+        kwargs = {}
+        if agent_name == "orthopedic" and routing.get('rag_results'):
+            kwargs["precomputed_rag"] = routing['rag_results']
+        agent_result = execute_agent(agent_name, user_message, conversation_history, **kwargs)
 
         return {
             "success": True,
@@ -10,23 +10,629 @@ Handles appointment scheduling for cardiology including:
 """
 
 import os
+import asyncio
+import copy
+import functools
+import hashlib
 import json
 import logging
+import re
+import threading
+from collections import Counter
 from typing import Dict, List, Any, Optional
-from openai import OpenAI
-
-# Import dependencies
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Top-level modules (prompts, tools, rag) resolve via the project install
+# (see pyproject.toml) or the repo root being the working directory; the
+# former sys.path.append hack penalized every subsequent import site-wide.
+# The openai package itself (httpx, pydantic, anyio) is imported lazily in
+# _get_openai_client so importing this module for triage or metrics helpers
+# stays cheap.
 from prompts import CARDIOLOGY_AGENT_PROMPT
 from tools import TOOL_DEFINITIONS, execute_tool_call
 from rag import retrieve_policies
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# orjson parses and serializes tool payloads several times faster than the
+# stdlib json module; fall back transparently when it is not installed.
+# orjson.JSONDecodeError subclasses ValueError, as does json.JSONDecodeError,
+# so parse errors are caught with ValueError either way.
+try:
+    import orjson
+
+    def _json_loads(data: str) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+
+# ============================================================================
+# URGENCY TRIAGE KEYWORDS
+# ============================================================================
+# Module-level so the request handler, assess_cardiac_urgency, and the
+# semantic cache's lexical guard all share one source of truth.
+
+EMERGENCY_KEYWORDS = (
+    "chest pain", "severe pain", "heart attack", "can't breathe",
+    "shortness of breath", "passing out", "unconscious", "crushing pain",
+    "radiating pain", "sweating", "nausea and chest pain"
+)
+
+URGENT_KEYWORDS = (
+    "abnormal", "stress test", "palpitations", "rapid heart",
+    "irregular heartbeat", "dizzy", "lightheaded", "recent er visit"
+)
+
+# Precompiled alternations: one C-level scan over the message instead of a
+# Python loop of substring tests, and IGNORECASE avoids the .lower() copy
+_EMERGENT_RE = re.compile(
+    "|".join(re.escape(k) for k in EMERGENCY_KEYWORDS), re.IGNORECASE
+)
+_URGENT_RE = re.compile(
+    "|".join(re.escape(k) for k in URGENT_KEYWORDS), re.IGNORECASE
+)
+
+# When pyahocorasick is installed both keyword classes are matched in a
+# single automaton walk over the message; otherwise the two compiled
+# alternations above serve as the fallback.
+try:
+    import ahocorasick
+
+    _URGENCY_AUTOMATON = ahocorasick.Automaton()
+    for _kw in EMERGENCY_KEYWORDS:
+        _URGENCY_AUTOMATON.add_word(_kw, "emergent")
+    for _kw in URGENT_KEYWORDS:
+        _URGENCY_AUTOMATON.add_word(_kw, "urgent")
+    _URGENCY_AUTOMATON.make_automaton()
+except ImportError:
+    _URGENCY_AUTOMATON = None
+
+
+def _classify_urgency(user_message: str, message_lower: Optional[str] = None) -> str:
+    """
+    Classify a message as "emergent", "urgent", or "routine" in one pass.
+
+    Uses the Aho-Corasick automaton when available so both keyword classes
+    are found in a single scan; emergent always wins over urgent. Callers
+    that already hold a lowercased copy can pass it to skip the allocation.
+    """
+    if _URGENCY_AUTOMATON is not None:
+        if message_lower is None:
+            message_lower = user_message.lower()
+        saw_urgent = False
+        for _, keyword_class in _URGENCY_AUTOMATON.iter(message_lower):
+            if keyword_class == "emergent":
+                return "emergent"
+            saw_urgent = True
+        return "urgent" if saw_urgent else "routine"
+
+    if _EMERGENT_RE.search(user_message) is not None:
+        return "emergent"
+    if _URGENT_RE.search(user_message) is not None:
+        return "urgent"
+    return "routine"
+
+
+# ============================================================================
+# SHARED OPENAI CLIENT
+# ============================================================================
+# Constructing a client allocates an httpx client and connection pool on
+# every call, and discarding it afterwards forces a fresh TLS handshake per
+# request. A lazy module singleton keeps connections alive across requests.
+
+_openai_client: Optional["AsyncOpenAI"] = None
+_openai_client_lock = threading.Lock()
+
+
+def _get_openai_client() -> Optional["AsyncOpenAI"]:
+    """
+    Get or create the shared async OpenAI client (double-checked locking).
+
+    The openai import happens here, on first use, rather than at module
+    load - it pulls in httpx/pydantic/anyio and dominates import time.
+
+    Returns:
+        Shared AsyncOpenAI client, or None if OPENAI_API_KEY is not configured
+    """
+    global _openai_client
+    if _openai_client is None:
+        with _openai_client_lock:
+            if _openai_client is None:
+                api_key = os.getenv("OPENAI_API_KEY")
+                if not api_key:
+                    return None
+                from openai import AsyncOpenAI
+                _openai_client = AsyncOpenAI(api_key=api_key)
+    return _openai_client
+
+
+# Canned response for emergent requests - returned immediately, without any
+# RAG retrieval or OpenAI roundtrip, since every second counts
+EMERGENCY_RESPONSE = (
+    "IMPORTANT: If you are experiencing severe chest pain or cardiac "
+    "symptoms, please call 911 or go to the nearest emergency room "
+    "immediately. Do not wait for an appointment.\n\n"
+    "Once you have been evaluated, our cardiology team can help you "
+    "schedule any follow-up care you need at 1-800-BSW-HEALTH."
+)
+
+
+# ============================================================================
+# SEMANTIC RESPONSE CACHE
+# ============================================================================
+# FAQ-style questions ("Does Medicare require a referral to see a
+# cardiologist?") repeat across users with light paraphrasing, and each one
+# costs a full OpenAI roundtrip even though the answer never changes.
+# Read-only responses (no tool calls, non-emergent) are cached in a small
+# in-memory chroma collection so near-duplicate questions are answered
+# directly, skipping the LLM entirely.
+
+SEMANTIC_CACHE_SIMILARITY_THRESHOLD = 0.87
+
+# Lexical guard: embedding similarity alone can collapse clinically distinct
+# entities ("Medicare" vs "Medicaid", "warfarin" vs "Coumadin") into the same
+# cache bucket. A cached answer is only reused when these critical tokens
+# match the query's exactly.
+_PAYER_TERMS = ("medicare", "medicaid", "bcbs", "aetna", "cigna", "united")
+
+_DRUG_TERMS = (
+    "warfarin", "coumadin", "eliquis", "xarelto", "metoprolol",
+    "amiodarone", "aspirin", "plavix", "statin"
+)
+
+CRITICAL_TERMS = frozenset(
+    word
+    for phrase in EMERGENCY_KEYWORDS + URGENT_KEYWORDS
+    for word in phrase.split()
+) | frozenset(_PAYER_TERMS) | frozenset(_DRUG_TERMS)
+
+_PATIENT_ID_RE = re.compile(r"PT\d+")
+_WORD_RE = re.compile(r"\w+")
+
+_semantic_cache = None
+_semantic_cache_lock = threading.Lock()
+
+
+def _extract_critical_tokens(user_message: str) -> str:
+    """
+    Extract the payer/drug/symptom tokens and patient IDs that must match
+    exactly between a query and a cached entry.
+
+    Returns:
+        Space-joined sorted token string (stable cache metadata key)
+    """
+    tokens = CRITICAL_TERMS.intersection(_WORD_RE.findall(user_message.lower()))
+    tokens |= set(_PATIENT_ID_RE.findall(user_message))
+    return " ".join(sorted(tokens))
+
+
+def _get_semantic_cache():
+    """
+    Lazily create the in-memory chroma collection backing the response cache.
+
+    Uses chroma's default embedding function (all-MiniLM-L6-v2, local CPU
+    inference) so cache lookups never add an embedding API roundtrip.
+    """
+    global _semantic_cache
+    if _semantic_cache is None:
+        with _semantic_cache_lock:
+            if _semantic_cache is None:
+                import chromadb
+                from chromadb.config import Settings
+                from chromadb.utils import embedding_functions
+
+                client = chromadb.EphemeralClient(
+                    settings=Settings(anonymized_telemetry=False)
+                )
+                _semantic_cache = client.get_or_create_collection(
+                    name="cardiology_response_cache",
+                    embedding_function=embedding_functions.DefaultEmbeddingFunction(),
+                    metadata={"hnsw:space": "cosine"}
+                )
+    return _semantic_cache
+
+
+def _normalize_message(user_message: str) -> str:
+    """Normalize a message for cache keying (case/whitespace-insensitive)."""
+    return " ".join(user_message.lower().split())
+
+
+def _check_semantic_cache(user_message: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached response for a semantically equivalent message.
+
+    Args:
+        user_message: Current user message
+
+    Returns:
+        Deep copy of the cached result dict when the nearest cached entry's
+        cosine similarity meets the threshold, or None on a miss
+    """
+    try:
+        cache = _get_semantic_cache()
+        if cache.count() == 0:
+            return None
+
+        results = cache.query(
+            query_texts=[_normalize_message(user_message)],
+            n_results=1
+        )
+        if not results["ids"] or not results["ids"][0]:
+            return None
+
+        # Collection uses cosine space, so similarity = 1 - distance
+        similarity = 1.0 - results["distances"][0][0]
+        if similarity < SEMANTIC_CACHE_SIMILARITY_THRESHOLD:
+            return None
+
+        metadata = results["metadatas"][0][0]
+        if not metadata.get("no_tool_calls"):
+            return None
+
+        # Lexical guard: reject hits whose critical clinical entities differ
+        # from the query's, even when embeddings consider them equivalent
+        if metadata.get("critical_tokens", "") != _extract_critical_tokens(user_message):
+            return None
+
+        cached = _json_loads(metadata["result"])
+        cached["cache_hit"] = True
+        cached["tokens_used"] = {"prompt": 0, "completion": 0, "total": 0}
+
+        logger.info(f"Semantic cache hit (similarity={similarity:.3f})")
+        return copy.deepcopy(cached)
+
+    except Exception as e:
+        logger.warning(f"Semantic cache lookup failed: {str(e)}")
+        return None
+
+
+def _store_in_semantic_cache(user_message: str, result: Dict[str, Any]) -> None:
+    """
+    Cache a read-only result for future near-duplicate queries.
+
+    Only responses that required no tool calls and are not emergent are
+    cached - anything that touched state (e.g. book_appointment) or carries
+    an emergency warning must always go through the full agent path.
+
+    Args:
+        user_message: The message that produced the result
+        result: Final result dict from handle_cardiology_request
+    """
+    if result.get("tools_used") or result.get("urgency_level") == "emergent":
+        return
+
+    try:
+        cache = _get_semantic_cache()
+        normalized = _normalize_message(user_message)
+        cache_id = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+        cache.upsert(
+            ids=[cache_id],
+            documents=[normalized],
+            metadatas=[{
+                "result": _json_dumps(result),
+                "no_tool_calls": True,
+                "critical_tokens": _extract_critical_tokens(user_message)
+            }]
+        )
+    except Exception as e:
+        logger.warning(f"Semantic cache store failed: {str(e)}")
+
+
+# ============================================================================
+# CONVERSATION HISTORY TRIMMING
+# ============================================================================
+# prompt_tokens dominate both cost and server-side prefill latency on
+# GPT-4o-mini, and history otherwise grows without bound across turns.
+
+HISTORY_TOKEN_BUDGET = 4000
+
+_token_encoder = None
+_token_encoder_unavailable = False
+
+
+def _get_token_encoder():
+    """
+    Lazily load and cache the tiktoken encoder; None when unavailable.
+
+    get_encoding("cl100k_base") is used directly instead of
+    encoding_for_model, skipping the model-name registry lookup.
+    """
+    global _token_encoder, _token_encoder_unavailable
+    if _token_encoder is None and not _token_encoder_unavailable:
+        try:
+            import tiktoken
+            _token_encoder = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _token_encoder_unavailable = True
+    return _token_encoder
+
+
+def _count_tokens(text: str) -> int:
+    """
+    Count tokens with tiktoken when available, falling back to a word-based
+    estimate otherwise.
+    """
+    encoder = _get_token_encoder()
+    if encoder is not None:
+        # encode_ordinary skips special-token scanning, which chat text
+        # never contains
+        return len(encoder.encode_ordinary(text))
+
+    # Rough approximation: 1 word ~= 1.3 tokens
+    return int(len(text.split()) * 1.3)
+
+
+def _truncate_to_tokens(text: str, budget: int) -> str:
+    """
+    Truncate text to a token budget on a token boundary, falling back to a
+    word-based cut when tiktoken is unavailable.
+    """
+    encoder = _get_token_encoder()
+    if encoder is not None:
+        tokens = encoder.encode_ordinary(text)
+        if len(tokens) <= budget:
+            return text
+        return encoder.decode(tokens[:budget])
+
+    words = text.split()
+    max_words = int(budget / 1.3)
+    if len(words) <= max_words:
+        return text
+    return " ".join(words[:max_words])
+
+
+def _trim_history(
+    history: Optional[List[Dict[str, str]]],
+    max_tokens: int = HISTORY_TOKEN_BUDGET
+) -> List[Dict[str, str]]:
+    """
+    Trim conversation history to a sliding token window, keeping the newest
+    turns.
+
+    Assistant tool-call messages and their trailing tool results are kept or
+    dropped as a unit - splitting them produces an invalid message sequence
+    that the API rejects. The newest unit is always kept, even if it alone
+    exceeds the budget.
+
+    Args:
+        history: Previous conversation messages (oldest first)
+        max_tokens: Token budget for retained history
+
+    Returns:
+        Trimmed history list (oldest first)
+    """
+    if not history:
+        return []
+
+    # Group tool results with the message that produced them
+    units: List[List[Dict[str, str]]] = []
+    for msg in history:
+        if msg.get("role") == "tool" and units:
+            units[-1].append(msg)
+        else:
+            units.append([msg])
+
+    # Walk newest-first, keeping units while they fit the budget
+    kept: List[List[Dict[str, str]]] = []
+    budget = max_tokens
+    for unit in reversed(units):
+        cost = sum(_count_tokens(m.get("content") or "") for m in unit)
+        if kept and cost > budget:
+            break
+        kept.append(unit)
+        budget -= cost
+
+    return [msg for unit in reversed(kept) for msg in unit]
+
+
+def _build_messages(
+    user_message: str,
+    conversation_history: Optional[List[Dict[str, str]]],
+    rag_context: str
+) -> List[Dict[str, Any]]:
+    """
+    Assemble the OpenAI messages list: system prompt (with RAG context),
+    prior conversation turns, then the current user message.
+
+    Args:
+        user_message: Current user message
+        conversation_history: Previous conversation messages
+        rag_context: Formatted RAG context block (may be empty)
+
+    Returns:
+        Messages list ready for the chat completions API
+    """
+    # The static agent prompt stays byte-identical as messages[0] so OpenAI's
+    # automatic prefix caching (applied to repeated prefixes >= 1024 tokens)
+    # can discount and pre-fill it; the per-query RAG block rides in its own
+    # system message so it never perturbs that prefix.
+    messages: List[Dict[str, Any]] = [
+        {"role": "system", "content": CARDIOLOGY_AGENT_PROMPT}
+    ]
+    if rag_context:
+        messages.append({"role": "system", "content": rag_context})
+
+    for msg in _trim_history(conversation_history):
+        role = msg.get("role", "user")
+        content = msg.get("content", "")
+
+        # Handle tool messages from previous calls
+        if role == "tool":
+            messages.append({
+                "role": "tool",
+                "tool_call_id": msg.get("tool_call_id", "unknown"),
+                "content": content
+            })
+        else:
+            messages.append({
+                "role": role,
+                "content": content
+            })
+
+    messages.append({
+        "role": "user",
+        "content": user_message
+    })
+
+    return messages
+
+
+# Total token budget for the RAG context block, split evenly across
+# policies that survive deduplication.
+RAG_CONTEXT_TOKEN_BUDGET = 300
+
+# Policies whose word sets overlap above this Jaccard similarity are
+# near-duplicates; keeping both just repeats prompt tokens.
+RAG_DEDUPE_SIMILARITY = 0.9
+
+
+def _policy_overlap(a: str, b: str) -> float:
+    """Jaccard similarity between the word sets of two policy texts."""
+    words_a = set(_WORD_RE.findall(a.lower()))
+    words_b = set(_WORD_RE.findall(b.lower()))
+    if not words_a or not words_b:
+        return 0.0
+    return len(words_a & words_b) / len(words_a | words_b)
+
+
+@functools.lru_cache(maxsize=512)
+def _retrieve_policies_cached(query: str, n_results: int) -> List[Dict[str, Any]]:
+    """
+    Memoized wrapper around retrieve_policies keyed on the normalized query.
+
+    Multi-turn conversations and router -> agent flows frequently re-issue
+    the same retrieval; the LRU lets every stage in the process reuse it
+    instead of re-embedding the query. Callers must treat the returned
+    policies as read-only since the list is shared across cache hits.
+    """
+    return retrieve_policies(query, n_results)
+
+
+def _normalize_rag_query(query: str) -> str:
+    """Collapse whitespace and case so trivially different queries share a cache slot."""
+    return " ".join(query.lower().split())
+
+
+def get_rag_cache_stats() -> Dict[str, int]:
+    """Return retrieval-cache hit/miss counters for metrics dashboards."""
+    info = _retrieve_policies_cached.cache_info()
+    return {
+        "rag_cache_hits": info.hits,
+        "embed_count": info.misses,
+        "cached_queries": info.currsize
+    }
+
+
+def _retrieve_rag_context(user_message: str) -> str:
+    """
+    Retrieve relevant cardiology protocols and format them as a system
+    prompt suffix.
+
+    Near-duplicate policies are dropped and the surviving ones are truncated
+    on token boundaries to a shared budget, so every request spends a
+    predictable number of prompt tokens on context.
+
+    Args:
+        user_message: Current user message
+
+    Returns:
+        Formatted RAG context block, or empty string when retrieval fails
+    """
+    rag_context = ""
+    try:
+        policies = _retrieve_policies_cached(
+            _normalize_rag_query(f"cardiology {user_message}"), 2
+        )
+
+        # Drop near-duplicates before spending prompt tokens on them
+        deduped: List[Dict[str, Any]] = []
+        for policy in policies:
+            if any(
+                _policy_overlap(policy["content"], kept["content"]) > RAG_DEDUPE_SIMILARITY
+                for kept in deduped
+            ):
+                continue
+            deduped.append(policy)
+
+        if deduped:
+            per_policy_budget = RAG_CONTEXT_TOKEN_BUDGET // len(deduped)
+            rag_context = "\n\n---RELEVANT PROTOCOLS & POLICIES---\n"
+            for policy in deduped:
+                rag_context += f"\n{policy['metadata'].get('title', 'Policy')}\n"
+                rag_context += f"{_truncate_to_tokens(policy['content'], per_policy_budget)}\n"
+            logger.info(f"Retrieved {len(deduped)} relevant cardiology protocols")
+    except Exception as e:
+        logger.warning(f"Error retrieving RAG context: {str(e)}")
+    return rag_context
+
+
+# ============================================================================
+# POLICY-QUESTION FAST PATH
+# ============================================================================
+# Coverage/referral questions ("Does Medicare require a referral to see a
+# cardiologist?") need a single policy lookup, not a tool-calling LLM loop.
+# An interrogative followed by a policy noun marks the fast path; any
+# scheduling language opts back into the full agent.
+
+_POLICY_QUESTION_RE = re.compile(
+    r"\b(does|do|is|are|what|when|how|can|will)\b.*"
+    r"\b(medicare|medicaid|referral|insurance|coverage|covered|copay|policy|require[sd]?)\b",
+    re.IGNORECASE | re.DOTALL
+)
+
+_SCHEDULING_INTENT_RE = re.compile(
+    r"\b(schedule|book|appointment|reschedule|cancel)\b", re.IGNORECASE
+)
+
+
+def _is_policy_question(user_message: str) -> bool:
+    """True when the message is a policy question with no scheduling intent."""
+    return (
+        _POLICY_QUESTION_RE.search(user_message) is not None
+        and _SCHEDULING_INTENT_RE.search(user_message) is None
+    )
+
+
+def _answer_policy_question(user_message: str) -> Optional[Dict[str, Any]]:
+    """
+    Answer a policy-only question straight from the top RAG result.
+
+    Returns:
+        Result dict in the standard handler shape, or None when retrieval
+        fails or comes back empty (caller falls through to the full LLM path)
+    """
+    try:
+        policies = _retrieve_policies_cached(
+            _normalize_rag_query(f"cardiology {user_message}"), 1
+        )
+    except Exception as e:
+        logger.warning(f"Policy fast-path retrieval failed: {str(e)}")
+        return None
+
+    if not policies:
+        return None
+
+    title = policies[0]["metadata"].get("title", "Policy")
+    content = _truncate_to_tokens(policies[0]["content"], 450)
+    logger.info("Policy fast path answered without LLM call")
+    return {
+        "success": True,
+        "response": f"{title}:\n\n{content}",
+        "tools_used": [],
+        "appointment_details": None,
+        "urgency_level": "routine",
+        "model_used": "rag-direct",
+        "tokens_used": {"prompt": 0, "completion": 0, "total": 0},
+        "iterations": 0
+    }
+
 
 def handle_cardiology_request(
     user_message: str,
@@ -58,10 +664,69 @@ def handle_cardiology_request(
             - error: str - Error message if failed
             - tokens_used: Dict - Token usage metrics
     """
+    return asyncio.run(
+        _handle_cardiology_request_async(user_message, conversation_history)
+    )
+
+
+async def _handle_cardiology_request_async(
+    user_message: str,
+    conversation_history: Optional[List[Dict[str, str]]] = None
+) -> Dict[str, Any]:
+    """
+    Async implementation behind handle_cardiology_request.
+
+    RAG retrieval and the semantic-cache lookup are independent I/O at the
+    start of a request, so they run concurrently; the LLM loop uses the
+    shared AsyncOpenAI client.
+    """
     try:
-        # Initialize OpenAI client
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+        # Triage before any LLM work: true emergencies get an immediate
+        # canned 911 response - the one case where latency matters most
+        urgency_level = _classify_urgency(user_message)
+        if urgency_level == "emergent":
+            logger.warning(f"EMERGENCY KEYWORDS DETECTED: {user_message[:100]}")
+            return {
+                "success": True,
+                "response": EMERGENCY_RESPONSE,
+                "tools_used": [],
+                "appointment_details": None,
+                "urgency_level": "emergent",
+                "tokens_used": {"prompt": 0, "completion": 0, "total": 0},
+                "iterations": 0
+            }
+
+        # Kick off RAG retrieval now - its result is only needed before the
+        # first LLM call, so it can overlap the semantic-cache lookup
+        rag_task = asyncio.create_task(
+            asyncio.to_thread(_retrieve_rag_context, user_message)
+        )
+
+        # Serve FAQ-style repeat questions from the semantic cache without
+        # touching OpenAI. Only single-turn requests are eligible - cached
+        # answers cannot account for earlier conversation context.
+        if not conversation_history:
+            cached_result = await asyncio.to_thread(
+                _check_semantic_cache, user_message
+            )
+            if cached_result is not None:
+                rag_task.cancel()
+                return cached_result
+
+        # Policy-only questions are answered from the top RAG result,
+        # skipping the completion step entirely
+        if not conversation_history and _is_policy_question(user_message):
+            policy_answer = await asyncio.to_thread(
+                _answer_policy_question, user_message
+            )
+            if policy_answer is not None:
+                rag_task.cancel()
+                return policy_answer
+
+        # Get the shared OpenAI client (reuses httpx connection pool)
+        client = _get_openai_client()
+        if client is None:
+            rag_task.cancel()
             logger.error("OPENAI_API_KEY not found in environment")
             return {
                 "success": False,
@@ -69,79 +734,25 @@ def handle_cardiology_request(
                 "response": "I apologize, but I'm having trouble connecting to my scheduling system. Please contact our office directly at 1-800-BSW-HEALTH."
             }
 
-        client = OpenAI(api_key=api_key)
-
-        # Retrieve relevant clinical protocols for cardiology
-        rag_context = ""
-        try:
-            policies = retrieve_policies(f"cardiology {user_message}", n_results=2)
-            if policies:
-                rag_context = "\n\n---RELEVANT PROTOCOLS & POLICIES---\n"
-                for policy in policies:
-                    rag_context += f"\n{policy['metadata'].get('title', 'Policy')}\n"
-                    rag_context += f"{policy['content'][:400]}...\n"
-                logger.info(f"Retrieved {len(policies)} relevant cardiology protocols")
-        except Exception as e:
-            logger.warning(f"Error retrieving RAG context: {str(e)}")
-
-        # Build conversation context
-        if conversation_history is None:
-            conversation_history = []
-
-        # Create messages for OpenAI API
-        messages = [
-            {"role": "system", "content": CARDIOLOGY_AGENT_PROMPT + rag_context}
-        ]
-
-        # Add conversation history
-        for msg in conversation_history:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
+        # Relevant clinical protocols for cardiology (retrieval started above)
+        rag_context = await rag_task
 
-            # Handle tool messages from previous calls
-            if role == "tool":
-                messages.append({
-                    "role": "tool",
-                    "tool_call_id": msg.get("tool_call_id", "unknown"),
-                    "content": content
-                })
-            else:
-                messages.append({
-                    "role": role,
-                    "content": content
-                })
-
-        # Add current user message
-        messages.append({
-            "role": "user",
-            "content": user_message
-        })
+        # Build conversation context for the OpenAI API
+        messages = _build_messages(user_message, conversation_history, rag_context)
 
         logger.info(f"Processing cardiology request: '{user_message[:100]}...'")
 
-        # Track tools used, appointment details, and urgency
+        # Track tools used, appointment details, and token usage
+        # (urgency_level was already assessed during triage above)
         tools_used = []
         appointment_details = None
-        urgency_level = "routine"  # Default
         total_tokens = {"prompt": 0, "completion": 0, "total": 0}
 
-        # Check for emergency keywords in user message
-        emergency_keywords = [
-            "chest pain", "severe pain", "heart attack", "can't breathe",
-            "shortness of breath", "passing out", "unconscious", "crushing pain",
-            "radiating pain", "sweating", "nausea and chest pain"
-        ]
-
-        message_lower = user_message.lower()
-        if any(keyword in message_lower for keyword in emergency_keywords):
-            urgency_level = "emergent"
-            logger.warning(f"EMERGENCY KEYWORDS DETECTED: {user_message[:100]}")
-
         # Iterative function calling loop (max 10 iterations)
         max_iterations = 10
         for iteration in range(max_iterations):
             # Call OpenAI API with function calling (parallel enabled)
-            response = client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=messages,
                 tools=TOOL_DEFINITIONS,
@@ -160,13 +771,10 @@ def handle_cardiology_request(
 
             # Check if we're done (no tool calls)
             if not assistant_message.tool_calls:
-                # Final response
+                # Final response (emergent requests never reach this path -
+                # they are short-circuited during triage)
                 final_response = assistant_message.content
 
-                # If emergency detected, prepend warning
-                if urgency_level == "emergent" and "911" not in final_response and "emergency" not in final_response.lower():
-                    final_response = "=� IMPORTANT: If you are experiencing severe chest pain or cardiac symptoms, please call 911 or go to the nearest emergency room immediately. Do not wait for an appointment.\n\n" + final_response
-
                 result = {
                     "success": True,
                     "response": final_response,
@@ -182,46 +790,50 @@ def handle_cardiology_request(
                 logger.info(f"Tools used: {', '.join(tools_used) if tools_used else 'None'}")
                 logger.info(f"Urgency level: {urgency_level}")
 
-                return result
+                # Cache read-only responses for future paraphrased repeats
+                if not conversation_history:
+                    _store_in_semantic_cache(user_message, result)
 
-            # Process tool calls
-            messages.append({
-                "role": "assistant",
-                "content": assistant_message.content,
-                "tool_calls": [
-                    {
-                        "id": tc.id,
-                        "type": tc.type,
-                        "function": {
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments
-                        }
-                    }
-                    for tc in assistant_message.tool_calls
-                ]
-            })
+                return result
 
-            for tool_call in assistant_message.tool_calls:
-                function_name = tool_call.function.name
-                function_args = json.loads(tool_call.function.arguments)
+            # Process tool calls. The SDK message is already a Pydantic model
+            # that knows its own JSON shape - serialize it once instead of
+            # re-wrapping each tool call by hand.
+            messages.append(
+                assistant_message.model_dump(exclude_unset=True, exclude_none=True)
+            )
 
+            parsed_calls = [
+                (tc.id, tc.function.name, _json_loads(tc.function.arguments))
+                for tc in assistant_message.tool_calls
+            ]
+            for _, function_name, function_args in parsed_calls:
                 logger.info(f"Calling tool: {function_name} with args: {function_args}")
                 tools_used.append(function_name)
 
-                # Execute the tool
-                tool_result = execute_tool_call(function_name, function_args)
+            # Tools in one parallel batch are independent and I/O-bound, so
+            # run them concurrently: the batch costs max-of-latencies instead
+            # of sum-of-latencies. Results stay aligned with their calls.
+            tool_results = await asyncio.gather(*[
+                asyncio.to_thread(execute_tool_call, name, args)
+                for _, name, args in parsed_calls
+            ])
 
+            tool_messages = []
+            for (call_id, function_name, _), tool_result in zip(parsed_calls, tool_results):
                 # Track appointment details if booking occurred
                 if function_name == "book_appointment" and tool_result.get("success"):
                     appointment_details = tool_result.get("appointment_details", {})
 
-                # Add tool result to messages
-                messages.append({
+                tool_messages.append({
                     "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "content": json.dumps(tool_result)
+                    "tool_call_id": call_id,
+                    "content": _json_dumps(tool_result)
                 })
 
+            # One extend per batch of parallel tool calls
+            messages.extend(tool_messages)
+
         # If we hit max iterations, return what we have
         logger.warning(f"Reached max iterations ({max_iterations})")
         return {
@@ -234,7 +846,7 @@ def handle_cardiology_request(
             "tokens_used": total_tokens
         }
 
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         logger.error(f"JSON decode error: {str(e)}")
         return {
             "success": False,
@@ -257,6 +869,188 @@ def handle_cardiology_request(
         }
 
 
+def handle_cardiology_requests_batch(
+    user_messages: List[str],
+    max_concurrency: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Handle a burst of independent single-turn cardiology requests.
+
+    Interactive traffic should keep using handle_cardiology_request; this
+    entry point is for bulk workloads (evaluation runs, burst traffic) where
+    many independent messages arrive together. Requests are multiplexed
+    concurrently over the shared AsyncOpenAI connection pool instead of
+    serializing one network roundtrip at a time, with a semaphore bounding
+    in-flight API calls to stay inside rate limits. Cache hits and emergent
+    short-circuits resolve without consuming a slot's LLM roundtrip.
+
+    Args:
+        user_messages: Independent single-turn user messages
+        max_concurrency: Maximum number of in-flight requests
+
+    Returns:
+        List of result dictionaries, in the same order as user_messages
+    """
+    async def _run_all() -> List[Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run_one(message: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await _handle_cardiology_request_async(message)
+
+        return list(await asyncio.gather(*(_run_one(m) for m in user_messages)))
+
+    return asyncio.run(_run_all())
+
+
+async def _handle_cardiology_request_stream_async(
+    user_message: str,
+    conversation_history: Optional[List[Dict[str, str]]] = None
+):
+    """
+    Async generator yielding incremental response text for a request.
+
+    Tool-call iterations cannot be streamed to the user (the tool_calls
+    payload must be complete before execution), so those are consumed
+    internally; content chunks from the terminal completion are yielded as
+    they arrive, cutting time-to-first-token versus waiting for the full
+    generation.
+    """
+    # Triage and cache short-circuits produce their full text at once
+    if _classify_urgency(user_message) == "emergent":
+        logger.warning(f"EMERGENCY KEYWORDS DETECTED: {user_message[:100]}")
+        yield EMERGENCY_RESPONSE
+        return
+
+    if not conversation_history:
+        cached_result = await asyncio.to_thread(_check_semantic_cache, user_message)
+        if cached_result is not None:
+            yield cached_result.get("response", "")
+            return
+
+    client = _get_openai_client()
+    if client is None:
+        logger.error("OPENAI_API_KEY not found in environment")
+        yield ("I apologize, but I'm having trouble connecting to my "
+               "scheduling system. Please contact our office directly at "
+               "1-800-BSW-HEALTH.")
+        return
+
+    rag_context = await asyncio.to_thread(_retrieve_rag_context, user_message)
+    messages = _build_messages(user_message, conversation_history, rag_context)
+
+    max_iterations = 10
+    for _ in range(max_iterations):
+        stream = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            tools=TOOL_DEFINITIONS,
+            tool_choice="auto",
+            parallel_tool_calls=True,
+            temperature=0.7,
+            max_tokens=1000,
+            stream=True
+        )
+
+        content_parts = []
+        tool_calls = {}
+
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+
+            if delta.tool_calls:
+                # Aggregate partial tool-call deltas by index
+                for tc in delta.tool_calls:
+                    entry = tool_calls.setdefault(
+                        tc.index, {"id": "", "name": "", "arguments": []}
+                    )
+                    if tc.id:
+                        entry["id"] = tc.id
+                    if tc.function and tc.function.name:
+                        entry["name"] = tc.function.name
+                    if tc.function and tc.function.arguments:
+                        entry["arguments"].append(tc.function.arguments)
+            elif delta.content:
+                content_parts.append(delta.content)
+                if not tool_calls:
+                    # Terminal content iteration - stream to the caller
+                    yield delta.content
+
+        if not tool_calls:
+            return
+
+        # Tool iteration: execute the aggregated calls, then loop again
+        assembled = [
+            {
+                "id": entry["id"],
+                "type": "function",
+                "function": {
+                    "name": entry["name"],
+                    "arguments": "".join(entry["arguments"])
+                }
+            }
+            for _, entry in sorted(tool_calls.items())
+        ]
+
+        messages.append({
+            "role": "assistant",
+            "content": "".join(content_parts) or None,
+            "tool_calls": assembled
+        })
+
+        for tool_call in assembled:
+            function_name = tool_call["function"]["name"]
+            function_args = _json_loads(tool_call["function"]["arguments"])
+
+            logger.info(f"Calling tool: {function_name} with args: {function_args}")
+            tool_result = execute_tool_call(function_name, function_args)
+
+            messages.append({
+                "role": "tool",
+                "tool_call_id": tool_call["id"],
+                "content": _json_dumps(tool_result)
+            })
+
+    logger.warning(f"Reached max iterations ({max_iterations}) while streaming")
+    yield ("I apologize, but I'm having trouble completing your request. "
+           "Please call our cardiology office directly for assistance.")
+
+
+def handle_cardiology_request_stream(
+    user_message: str,
+    conversation_history: Optional[List[Dict[str, str]]] = None
+):
+    """
+    Streaming variant of handle_cardiology_request.
+
+    Yields response text chunks as the model produces them, so callers can
+    render the first tokens immediately instead of blocking until the full
+    completion is generated. Tool-calling iterations are handled internally;
+    only final user-facing text is yielded.
+
+    Args:
+        user_message: Current user message
+        conversation_history: Previous conversation messages
+
+    Yields:
+        Response text chunks (str)
+    """
+    agen = _handle_cardiology_request_stream_async(
+        user_message, conversation_history
+    )
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.close()
+
+
 def handle_cardiology_conversation(
     user_message: str,
     conversation_history: Optional[List[Dict[str, str]]] = None,
@@ -291,48 +1085,37 @@ def handle_cardiology_conversation(
     return handle_cardiology_request(enhanced_message, conversation_history)
 
 
-def assess_cardiac_urgency(user_message: str) -> Dict[str, Any]:
+def assess_cardiac_urgency(
+    user_message: str,
+    message_lower: Optional[str] = None
+) -> Dict[str, Any]:
     """
     Quick triage assessment of cardiac urgency based on symptoms mentioned.
 
     Args:
         user_message: Patient's message
+        message_lower: Optional pre-lowercased copy of the message, so
+            callers that already hold one avoid a second allocation
 
     Returns:
         Dictionary with urgency assessment
     """
-    message_lower = user_message.lower()
+    urgency = _classify_urgency(user_message, message_lower)
 
-    # Emergency indicators
-    emergent_keywords = [
-        "chest pain", "severe pain", "crushing pain", "radiating pain",
-        "can't breathe", "shortness of breath", "passing out", "unconscious",
-        "heart attack", "sweating and pain", "nausea and chest pain"
-    ]
-
-    # Urgent indicators
-    urgent_keywords = [
-        "abnormal", "stress test", "palpitations", "rapid heart",
-        "irregular heartbeat", "dizzy", "lightheaded", "recent er visit"
-    ]
-
-    # Check for emergency
-    if any(keyword in message_lower for keyword in emergent_keywords):
+    if urgency == "emergent":
         return {
             "urgency_level": "emergent",
             "recommendation": "CALL 911 IMMEDIATELY - Do not schedule appointment",
             "reasoning": "Potential cardiac emergency detected"
         }
 
-    # Check for urgent
-    if any(keyword in message_lower for keyword in urgent_keywords):
+    if urgency == "urgent":
         return {
             "urgency_level": "urgent",
             "recommendation": "Schedule within 24-48 hours",
             "reasoning": "Urgent cardiac symptoms or abnormal test results"
         }
 
-    # Default to routine
     return {
         "urgency_level": "routine",
         "recommendation": "Schedule within 1-2 weeks",
@@ -360,27 +1143,24 @@ def get_cardiology_metrics(results: List[Dict[str, Any]]) -> Dict[str, Any]:
             "urgency_distribution": {}
         }
 
+    # Single pass over results: one traversal updates every aggregate
+    # instead of re-walking the list per metric
     total = len(results)
-    successful = sum(1 for r in results if r.get("success", False))
-    appointments_booked = sum(1 for r in results if r.get("appointment_details") is not None)
-
-    # Tool usage statistics
-    tool_usage = {}
-    for result in results:
-        for tool in result.get("tools_used", []):
-            tool_usage[tool] = tool_usage.get(tool, 0) + 1
+    successful = 0
+    appointments_booked = 0
+    total_tokens = 0
+    tool_usage = Counter()
+    urgency_distribution = Counter()
 
-    # Urgency distribution
-    urgency_distribution = {}
     for result in results:
-        urgency = result.get("urgency_level", "routine")
-        urgency_distribution[urgency] = urgency_distribution.get(urgency, 0) + 1
+        if result.get("success", False):
+            successful += 1
+        if result.get("appointment_details") is not None:
+            appointments_booked += 1
+        total_tokens += result.get("tokens_used", {}).get("total", 0)
+        tool_usage.update(result.get("tools_used", ()))
+        urgency_distribution[result.get("urgency_level", "routine")] += 1
 
-    # Token usage
-    total_tokens = sum(
-        result.get("tokens_used", {}).get("total", 0)
-        for result in results
-    )
     avg_tokens = total_tokens / total if total > 0 else 0
 
     return {
@@ -389,9 +1169,9 @@ def get_cardiology_metrics(results: List[Dict[str, Any]]) -> Dict[str, Any]:
         "appointment_booking_rate": appointments_booked / total if total > 0 else 0.0,
         "average_tokens": avg_tokens,
         "total_tokens": total_tokens,
-        "tool_usage": tool_usage,
+        "tool_usage": dict(tool_usage),
         "appointments_booked": appointments_booked,
-        "urgency_distribution": urgency_distribution
+        "urgency_distribution": dict(urgency_distribution)
     }
 
 
@@ -423,15 +1203,15 @@ if __name__ == "__main__":
         }
     ]
 
-    results = []
-    for i, test in enumerate(test_cases, 1):
+    # Batch entry point: the test cases are independent single-turn
+    # requests, so they multiplex over the shared connection pool
+    results = handle_cardiology_requests_batch([t["message"] for t in test_cases])
+
+    for i, (test, result) in enumerate(zip(test_cases, results), 1):
         print(f"Test Case {i}: {test['description']}")
         print(f"Message: {test['message']}")
         print()
 
-        result = handle_cardiology_request(test['message'])
-        results.append(result)
-
         print(f"Success: {'' if result.get('success') else ''}")
         print(f"Urgency Level: {result.get('urgency_level', 'N/A')}")
         print(f"Response: {result.get('response', 'N/A')[:300]}...")
@@ -0,0 +1,78 @@
+"""
+Local extractive summarizer for tool-output compression.
+
+The history/tool compactors need to shrink stale payloads on every loop
+iteration, and burning an API call per compression would cost more than it
+saves. This module does frequency-scored extractive summarization in pure
+Python - microseconds on CPU, no model download, no network. The expensive
+model is reserved for final reasoning; compression stays local and cheap.
+"""
+
+import re
+from collections import Counter
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have i if in is it no not "
+    "of on or that the their this to was we were will with you your".split()
+)
+
+
+def summarize(text: str, max_chars: int = 300) -> str:
+    """
+    Extract the highest-information sentences from text, up to max_chars.
+
+    Sentences are scored by summed corpus-local word frequency (stopwords
+    excluded) normalized by sentence length, and the chosen sentences keep
+    their original order. Text already within budget is returned as-is.
+
+    Args:
+        text: Text to compress
+        max_chars: Maximum length of the returned summary
+
+    Returns:
+        Extractive summary no longer than max_chars
+    """
+    text = " ".join(text.split())
+    if len(text) <= max_chars:
+        return text
+
+    sentences = _SENTENCE_RE.split(text)
+    if len(sentences) <= 1:
+        return text[:max_chars]
+
+    freq = Counter(
+        word for word in _WORD_RE.findall(text.lower())
+        if word not in _STOPWORDS
+    )
+
+    def _score(sentence: str) -> float:
+        words = [
+            word for word in _WORD_RE.findall(sentence.lower())
+            if word not in _STOPWORDS
+        ]
+        if not words:
+            return 0.0
+        return sum(freq[word] for word in words) / len(words)
+
+    ranked = sorted(
+        range(len(sentences)),
+        key=lambda i: _score(sentences[i]),
+        reverse=True
+    )
+
+    chosen = []
+    used = 0
+    for i in ranked:
+        cost = len(sentences[i]) + (1 if chosen else 0)
+        if used + cost > max_chars:
+            continue
+        chosen.append(i)
+        used += cost
+
+    if not chosen:
+        return sentences[ranked[0]][:max_chars]
+
+    return " ".join(sentences[i] for i in sorted(chosen))
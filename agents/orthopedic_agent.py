@@ -9,31 +9,301 @@ Handles appointment scheduling for orthopedic surgery including:
 """
 
 import os
+import asyncio
+import hashlib
 import json
 import logging
+import re
+import threading
+from collections import Counter, OrderedDict
 from typing import Dict, List, Any, Optional
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 # Import dependencies
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from prompts import ORTHOPEDIC_AGENT_PROMPT
-from tools import TOOL_DEFINITIONS, execute_tool_call
-from rag import retrieve_policies
+from tools import TOOL_DEFINITIONS, TOOLS_DEFINITIONS_JSON, execute_tool_call
+from rag import retrieve_policies_cached
+from agents.semantic_cache import SemanticCache
+from agents.local_summarizer import summarize
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# orjson is markedly faster than stdlib json for the per-tool-call parse
+# and serialize work inside the iteration loop; fall back when missing.
+# Both libraries raise ValueError subclasses on bad input.
+try:
+    import orjson
+
+    def _json_loads(data: str) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+# Messages that can plausibly benefit from a policy/protocol lookup; short
+# confirmations ("Yes", "I'm PT005") and plain scheduling chatter skip the
+# vector-store roundtrip entirely.
+_POLICY_TERM_RE = re.compile(
+    r"\b(insurance|coverage|covered|referral|policy|medicare|medicaid|copay|"
+    r"authorization|protocol|pre-?op|post-?op|surgery|replacement|follow-?up)\b",
+    re.IGNORECASE
+)
+
+
+def _needs_policy_lookup(user_message: str) -> bool:
+    """True when a RAG retrieval is worth its latency for this message."""
+    return (
+        len(user_message.split()) >= 4
+        and _POLICY_TERM_RE.search(user_message) is not None
+    )
+
+
+# Near-duplicate patient phrasings reuse the formatted RAG block instead
+# of re-running the embed + vector-store roundtrip
+_RAG_CONTEXT_CACHE = SemanticCache("orthopedic_rag_cache", threshold=0.95)
+
+# Stable key for OpenAI's automatic prompt caching. The static prefix
+# (agent prompt + tool schemas) is identical across requests, so pinning
+# every call to one cache key lets the API reuse its KV cache across loop
+# iterations and across users of this agent.
+PROMPT_CACHE_KEY = hashlib.sha256(
+    ORTHOPEDIC_AGENT_PROMPT.encode() + TOOLS_DEFINITIONS_JSON
+).hexdigest()[:32]
+
+# Shared OpenAI client: constructing one per request rebuilds the httpx
+# transport and connection pool, forcing a fresh TCP+TLS handshake every
+# call. A lazy module singleton keeps connections alive across requests.
+_openai_client: Optional[AsyncOpenAI] = None
+_openai_client_lock = threading.Lock()
+
+
+def _get_openai_client() -> Optional[AsyncOpenAI]:
+    """
+    Get or create the shared async OpenAI client (double-checked locking).
+
+    Returns:
+        Shared AsyncOpenAI client, or None if OPENAI_API_KEY is not configured
+    """
+    global _openai_client
+    if _openai_client is None:
+        with _openai_client_lock:
+            if _openai_client is None:
+                api_key = os.getenv("OPENAI_API_KEY")
+                if not api_key:
+                    return None
+                _openai_client = AsyncOpenAI(
+                    api_key=api_key,
+                    timeout=30.0,
+                    max_retries=2
+                )
+    return _openai_client
+
+
+# Token budget for prior turns and the number of recent turns always kept
+# verbatim; everything older gets collapsed into one model-written summary
+HISTORY_TOKEN_BUDGET = 2000
+HISTORY_KEEP_LAST = 6
+
+# Summaries memoized by prefix hash: a growing conversation re-summarizes
+# the same old turns on every request otherwise. Kept as a small LRU so a
+# long-lived process doesn't accumulate one entry per conversation prefix
+_HISTORY_SUMMARY_CACHE_MAX = 256
+_history_summary_cache: "OrderedDict[str, str]" = OrderedDict()
+
+_token_encoder = None
+_token_encoder_unavailable = False
+
+
+def _count_history_tokens(text: str) -> int:
+    """Token count via tiktoken when installed, else a word-based estimate."""
+    global _token_encoder, _token_encoder_unavailable
+    if _token_encoder is None and not _token_encoder_unavailable:
+        try:
+            import tiktoken
+            # cl100k_base directly: skips the model-name registry lookup
+            _token_encoder = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _token_encoder_unavailable = True
+
+    if _token_encoder is not None:
+        # encode_ordinary skips special-token scanning
+        return len(_token_encoder.encode_ordinary(text))
+    return int(len(text.split()) * 1.3)
+
+
+async def _compact_history(
+    history: List[Dict[str, str]],
+    client: AsyncOpenAI,
+    keep_last: int = HISTORY_KEEP_LAST,
+    max_tokens: int = HISTORY_TOKEN_BUDGET
+) -> List[Dict[str, str]]:
+    """
+    Bound the token cost of conversation history before it reaches the model.
+
+    The last keep_last turns stay raw. When the full history exceeds
+    max_tokens, all older turns are replaced with a single "[prior context]"
+    system message: a two-sentence summary that preserves patient ID,
+    insurance, condition, and pending actions. If summarization fails, the
+    old turns are dropped rather than blowing the budget.
+
+    Args:
+        history: Previous conversation messages (oldest first)
+        client: Shared async OpenAI client used for the one summary call
+        keep_last: Number of trailing turns kept verbatim
+        max_tokens: History token budget that triggers compaction
+
+    Returns:
+        Compacted history list (oldest first)
+    """
+    if not history:
+        return []
+
+    total = sum(_count_history_tokens(m.get("content") or "") for m in history)
+    if total <= max_tokens or len(history) <= keep_last:
+        return list(history)
+
+    split = len(history) - keep_last
+    # Never let the raw window start with an orphaned tool result
+    while split > 0 and history[split].get("role") == "tool":
+        split -= 1
+    old, recent = history[:split], history[split:]
+    if not old:
+        return list(history)
+
+    cache_key = hashlib.sha256(
+        "\x1e".join(m.get("content") or "" for m in old).encode("utf-8")
+    ).hexdigest()
+
+    summary = _history_summary_cache.get(cache_key)
+    if summary is not None:
+        _history_summary_cache.move_to_end(cache_key)
+    else:
+        try:
+            transcript = "\n".join(
+                f"{m.get('role', 'user')}: {m.get('content', '')}"
+                for m in old if m.get("content")
+            )
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": (
+                            "Summarize this scheduling conversation in at most "
+                            "2 sentences, preserving patient ID, insurance, "
+                            "condition, and any pending actions."
+                        )
+                    },
+                    {"role": "user", "content": transcript}
+                ],
+                temperature=0.0,
+                max_tokens=120
+            )
+            summary = response.choices[0].message.content.strip()
+            _history_summary_cache[cache_key] = summary
+            if len(_history_summary_cache) > _HISTORY_SUMMARY_CACHE_MAX:
+                _history_summary_cache.popitem(last=False)
+        except Exception as e:
+            logger.warning(f"History summarization failed: {str(e)}")
+            return recent
+
+    return [{"role": "system", "content": f"[prior context] {summary}"}] + recent
+
+
+def _compact_tool_messages(
+    messages: List[Dict[str, Any]],
+    keep_last: int = 2
+) -> List[Dict[str, Any]]:
+    """
+    Return a copy of messages with stale tool outputs compacted.
+
+    Each loop iteration resends every prior tool result verbatim, so prompt
+    tokens grow quadratically with iterations even though the model already
+    acted on the old payloads. Only the most recent keep_last tool messages
+    keep their full JSON; older ones are rewritten to a one-line status
+    summary. The caller's list is never mutated, so the persisted
+    conversation keeps full fidelity.
+
+    Args:
+        messages: Messages list about to be sent to the API
+        keep_last: Number of trailing tool messages left untouched
+
+    Returns:
+        Messages list safe to pass to chat.completions.create
+    """
+    tool_indices = [i for i, m in enumerate(messages) if m.get("role") == "tool"]
+    stale = tool_indices[:-keep_last] if keep_last else tool_indices
+    if not stale:
+        return messages
+
+    compacted = list(messages)
+    for i in stale:
+        msg = compacted[i]
+        try:
+            result = _json_loads(msg.get("content") or "")
+        except ValueError:
+            continue
+        if not isinstance(result, dict):
+            continue
+
+        status = "OK" if result.get("success", True) else "ERR"
+        details = [
+            f"{key}={len(value)}"
+            for key, value in result.items()
+            if isinstance(value, list)
+        ]
+        if status == "ERR" and result.get("error"):
+            details.append(str(result["error"])[:80])
+
+        # Long free-text fields get a local extractive summary so the model
+        # keeps the gist without the full payload; no API call involved
+        prose = " ".join(
+            value for value in result.values()
+            if isinstance(value, str) and len(value) > 40
+        )
+        if prose:
+            details.append(summarize(prose, max_chars=120))
+
+        summary = f"[tool result compacted] {status}"
+        if details:
+            summary += " | " + "; ".join(details[:3])
+        compacted[i] = {**msg, "content": summary}
+
+    return compacted
+
+
+def _format_rag_context(policies: List[Dict[str, Any]]) -> str:
+    """Format retrieved policy results into the system-message block."""
+    if not policies:
+        return ""
+    rag_context = "\n\n---RELEVANT PROTOCOLS & POLICIES---\n"
+    for policy in policies:
+        rag_context += f"\n{policy['metadata'].get('title', 'Policy')}\n"
+        rag_context += f"{policy['content'][:400]}...\n"
+    return rag_context
+
 
 def handle_orthopedic_request(
     user_message: str,
-    conversation_history: Optional[List[Dict[str, str]]] = None
+    conversation_history: Optional[List[Dict[str, str]]] = None,
+    precomputed_rag: Optional[List[Dict[str, Any]]] = None
 ) -> Dict[str, Any]:
     """
     Handle orthopedic appointment scheduling request.
 
+    Sync wrapper around the async implementation, kept for backward
+    compatibility with existing call sites.
+
     Uses OpenAI GPT-4o-mini with function calling to execute tools for:
     - Provider lookup
     - Appointment slot search
@@ -45,6 +315,9 @@ def handle_orthopedic_request(
         user_message: Current user message
         conversation_history: Previous conversation messages
                             Format: [{"role": "user|assistant|tool", "content": "..."}]
+        precomputed_rag: Policy results already retrieved upstream (e.g. by
+                        the router); when provided the agent skips its own
+                        retrieval and reuses them
 
     Returns:
         Dictionary containing:
@@ -55,10 +328,29 @@ def handle_orthopedic_request(
             - error: str - Error message if failed
             - tokens_used: Dict - Token usage metrics
     """
+    return asyncio.run(
+        _handle_orthopedic_request_async(
+            user_message, conversation_history, precomputed_rag
+        )
+    )
+
+
+async def _handle_orthopedic_request_async(
+    user_message: str,
+    conversation_history: Optional[List[Dict[str, str]]] = None,
+    precomputed_rag: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    Async implementation behind handle_orthopedic_request.
+
+    Parallel tool calls from one assistant message are executed
+    concurrently, so each batch costs its slowest member rather than the
+    sum of all latencies.
+    """
     try:
-        # Initialize OpenAI client
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+        # Get the shared OpenAI client (reuses httpx connection pool)
+        client = _get_openai_client()
+        if client is None:
             logger.error("OPENAI_API_KEY not found in environment")
             return {
                 "success": False,
@@ -66,29 +358,39 @@ def handle_orthopedic_request(
                 "response": "I apologize, but I'm having trouble connecting to my scheduling system. Please contact our office directly at 1-800-BSW-HEALTH."
             }
 
-        client = OpenAI(api_key=api_key)
-
-        # Retrieve relevant clinical protocols for orthopedic
-        rag_context = ""
-        try:
-            policies = retrieve_policies(f"orthopedic surgery {user_message}", n_results=2)
-            if policies:
-                rag_context = "\n\n---RELEVANT PROTOCOLS & POLICIES---\n"
-                for policy in policies:
-                    rag_context += f"\n{policy['metadata'].get('title', 'Policy')}\n"
-                    rag_context += f"{policy['content'][:400]}...\n"
-                logger.info(f"Retrieved {len(policies)} relevant orthopedic protocols")
-        except Exception as e:
-            logger.warning(f"Error retrieving RAG context: {str(e)}")
-
-        # Build conversation context
+        # Retrieve relevant clinical protocols for orthopedic, reusing the
+        # cached context block for near-duplicate phrasings. Results already
+        # fetched upstream (the router's batched retrieval) are reused
+        # directly; trivial messages skip retrieval entirely.
+        if precomputed_rag is not None:
+            rag_context = _format_rag_context(precomputed_rag)
+        else:
+            rag_context = "" if not _needs_policy_lookup(user_message) \
+                else _RAG_CONTEXT_CACHE.get(user_message)
+            if rag_context is None:
+                rag_context = ""
+                try:
+                    policies = retrieve_policies_cached(f"orthopedic surgery {user_message}", n_results=2)
+                    rag_context = _format_rag_context(policies)
+                    if policies:
+                        logger.info(f"Retrieved {len(policies)} relevant orthopedic protocols")
+                    _RAG_CONTEXT_CACHE.set(user_message, rag_context)
+                except Exception as e:
+                    logger.warning(f"Error retrieving RAG context: {str(e)}")
+
+        # Build conversation context, bounding old turns to the token budget
         if conversation_history is None:
             conversation_history = []
+        conversation_history = await _compact_history(conversation_history, client)
 
-        # Create messages for OpenAI API
+        # Create messages for OpenAI API. The static agent prompt stays
+        # byte-identical as messages[0] so the cached prefix is shared; the
+        # per-query RAG block rides in its own system message after it.
         messages = [
-            {"role": "system", "content": ORTHOPEDIC_AGENT_PROMPT + rag_context}
+            {"role": "system", "content": ORTHOPEDIC_AGENT_PROMPT}
         ]
+        if rag_context:
+            messages.append({"role": "system", "content": rag_context})
 
         # Add conversation history
         for msg in conversation_history:
@@ -121,31 +423,106 @@ def handle_orthopedic_request(
         appointment_details = None
         total_tokens = {"prompt": 0, "completion": 0, "total": 0}
 
-        # Iterative function calling loop (max 10 iterations)
+        # Iterative function calling loop (max 10 iterations). Responses are
+        # streamed so that, once the full completion budget is in effect,
+        # each tool call can be dispatched the moment its arguments finish
+        # arriving, overlapping the rest of the model's generation with
+        # tool execution.
         max_iterations = 10
+        # Tool-call turns emit short completions; reserving 1000 tokens for
+        # them inflates server-side batching slack. Start small and bump to
+        # the full budget only when a final answer gets clipped.
+        completion_budget = 250
         for iteration in range(max_iterations):
-            # Call OpenAI API with function calling (parallel enabled)
-            response = client.chat.completions.create(
+            stream = await client.chat.completions.create(
                 model="gpt-4o-mini",
-                messages=messages,
+                messages=_compact_tool_messages(messages),
                 tools=TOOL_DEFINITIONS,
                 tool_choice="auto",
                 parallel_tool_calls=True,  # Enable parallel function calling
                 temperature=0.7,
-                max_tokens=1000
+                max_tokens=completion_budget,
+                stream=True,
+                stream_options={"include_usage": True},
+                extra_body={"prompt_cache_key": PROMPT_CACHE_KEY}
             )
 
-            # Track token usage
-            total_tokens["prompt"] += response.usage.prompt_tokens
-            total_tokens["completion"] += response.usage.completion_tokens
-            total_tokens["total"] += response.usage.total_tokens
-
-            assistant_message = response.choices[0].message
+            content_parts = []
+            tool_calls = {}   # index -> {"id", "name", "arguments" fragments}
+            tool_tasks = {}   # index -> task started while still streaming
+            finish_reason = None
+
+            async for chunk in stream:
+                # Usage arrives on the terminal chunk
+                if chunk.usage is not None:
+                    total_tokens["prompt"] += chunk.usage.prompt_tokens
+                    total_tokens["completion"] += chunk.usage.completion_tokens
+                    total_tokens["total"] += chunk.usage.total_tokens
+                if not chunk.choices:
+                    continue
+
+                if chunk.choices[0].finish_reason:
+                    finish_reason = chunk.choices[0].finish_reason
+
+                delta = chunk.choices[0].delta
+                if delta is None:
+                    continue
+                if delta.content:
+                    content_parts.append(delta.content)
+
+                for tc in delta.tool_calls or ():
+                    entry = tool_calls.setdefault(
+                        tc.index, {"id": None, "name": None, "arguments": []}
+                    )
+                    if tc.id:
+                        entry["id"] = tc.id
+                    if tc.function:
+                        if tc.function.name:
+                            entry["name"] = tc.function.name
+                        if tc.function.arguments:
+                            entry["arguments"].append(tc.function.arguments)
+
+                    # Arguments stream as one JSON object; a successful parse
+                    # means the call is complete, so dispatch it immediately.
+                    # Only at the full budget though: under the reduced
+                    # tool-turn budget the turn may still get length-clipped
+                    # and discarded, and an eagerly executed call (e.g.
+                    # book_appointment) would run a second time on the retry
+                    if (
+                        completion_budget >= 1000
+                        and entry["name"]
+                        and tc.index not in tool_tasks
+                    ):
+                        args_str = "".join(entry["arguments"])
+                        if args_str:
+                            try:
+                                function_args = _json_loads(args_str)
+                            except ValueError:
+                                continue
+                            logger.info(
+                                f"Calling tool: {entry['name']} with args: {function_args}"
+                            )
+                            tools_used.append(entry["name"])
+                            tool_tasks[tc.index] = asyncio.create_task(
+                                asyncio.to_thread(
+                                    execute_tool_call, entry["name"], function_args
+                                )
+                            )
+
+            # A turn clipped by the tool-turn budget gets one retry with the
+            # full allowance. This covers tool-call turns too: when the cap
+            # hits mid-arguments the finish reason is "length" and the
+            # trailing call's JSON is truncated, so the whole turn must be
+            # discarded rather than parsed and executed. Dispatch is
+            # deferred under the reduced budget, so no tool has run yet and
+            # the retry cannot re-execute one
+            if finish_reason == "length" and completion_budget < 1000:
+                completion_budget = 1000
+                continue
 
             # Check if we're done (no tool calls)
-            if not assistant_message.tool_calls:
-                # Final response
-                final_response = assistant_message.content
+            if not tool_calls:
+                final_response = "".join(content_parts)
 
                 result = {
                     "success": True,
@@ -162,42 +539,48 @@ def handle_orthopedic_request(
 
                 return result
 
-            # Process tool calls
+            # Dispatch any call whose arguments only completed at stream end
+            for index, entry in tool_calls.items():
+                if index not in tool_tasks:
+                    function_args = _json_loads("".join(entry["arguments"]) or "{}")
+                    logger.info(
+                        f"Calling tool: {entry['name']} with args: {function_args}"
+                    )
+                    tools_used.append(entry["name"])
+                    tool_tasks[index] = asyncio.create_task(
+                        asyncio.to_thread(execute_tool_call, entry["name"], function_args)
+                    )
+
+            # Record the assistant turn, then collect results in call order
+            ordered = sorted(tool_calls.items())
             messages.append({
                 "role": "assistant",
-                "content": assistant_message.content,
+                "content": "".join(content_parts) or None,
                 "tool_calls": [
                     {
-                        "id": tc.id,
-                        "type": tc.type,
+                        "id": entry["id"],
+                        "type": "function",
                         "function": {
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments
+                            "name": entry["name"],
+                            "arguments": "".join(entry["arguments"])
                         }
                     }
-                    for tc in assistant_message.tool_calls
+                    for _, entry in ordered
                 ]
             })
 
-            for tool_call in assistant_message.tool_calls:
-                function_name = tool_call.function.name
-                function_args = json.loads(tool_call.function.arguments)
-
-                logger.info(f"Calling tool: {function_name} with args: {function_args}")
-                tools_used.append(function_name)
-
-                # Execute the tool
-                tool_result = execute_tool_call(function_name, function_args)
+            for index, entry in ordered:
+                tool_result = await tool_tasks[index]
 
                 # Track appointment details if booking occurred
-                if function_name == "book_appointment" and tool_result.get("success"):
+                if entry["name"] == "book_appointment" and tool_result.get("success"):
                     appointment_details = tool_result.get("appointment_details", {})
 
                 # Add tool result to messages
                 messages.append({
                     "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "content": json.dumps(tool_result)
+                    "tool_call_id": entry["id"],
+                    "content": _json_dumps(tool_result)
                 })
 
         # If we hit max iterations, return what we have
@@ -211,7 +594,7 @@ def handle_orthopedic_request(
             "tokens_used": total_tokens
         }
 
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         logger.error(f"JSON decode error: {str(e)}")
         return {
             "success": False,
@@ -283,21 +666,22 @@ def get_orthopedic_metrics(results: List[Dict[str, Any]]) -> Dict[str, Any]:
             "tool_usage": {}
         }
 
+    # Single pass over results: one traversal updates every aggregate
+    # instead of re-walking the list per metric
     total = len(results)
-    successful = sum(1 for r in results if r.get("success", False))
-    appointments_booked = sum(1 for r in results if r.get("appointment_details") is not None)
+    successful = 0
+    appointments_booked = 0
+    total_tokens = 0
+    tool_usage = Counter()
 
-    # Tool usage statistics
-    tool_usage = {}
     for result in results:
-        for tool in result.get("tools_used", []):
-            tool_usage[tool] = tool_usage.get(tool, 0) + 1
+        if result.get("success", False):
+            successful += 1
+        if result.get("appointment_details") is not None:
+            appointments_booked += 1
+        total_tokens += result.get("tokens_used", {}).get("total", 0)
+        tool_usage.update(result.get("tools_used", ()))
 
-    # Token usage
-    total_tokens = sum(
-        result.get("tokens_used", {}).get("total", 0)
-        for result in results
-    )
     avg_tokens = total_tokens / total if total > 0 else 0
 
     return {
@@ -306,7 +690,7 @@ def get_orthopedic_metrics(results: List[Dict[str, Any]]) -> Dict[str, Any]:
         "appointment_booking_rate": appointments_booked / total if total > 0 else 0.0,
         "average_tokens": avg_tokens,
         "total_tokens": total_tokens,
-        "tool_usage": tool_usage,
+        "tool_usage": dict(tool_usage),
         "appointments_booked": appointments_booked
     }
 
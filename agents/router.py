@@ -9,42 +9,187 @@ intent and select the best specialty agent for their needs.
 """
 
 import os
+import asyncio
+import hashlib
 import json
 import logging
+import random
+import re
+import threading
+from collections import Counter
 from typing import List, Dict, Optional, Any
 from datetime import datetime
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI, RateLimitError
 
 # Import prompts and RAG system
 try:
     from prompts import ROUTER_AGENT_PROMPT
-    from rag import retrieve_policies
+    from rag import retrieve_policies_cached
 except ImportError:
     # Fallback for testing
     ROUTER_AGENT_PROMPT = "You are a routing agent for a healthcare scheduling system."
-    def retrieve_policies(query: str, n_results: int = 3) -> List[Dict]:
+    def retrieve_policies_cached(query: str, n_results: int = 3) -> List[Dict]:
         return []
 
+from agents.semantic_cache import SemanticCache
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Near-duplicate routing queries reuse the cached decision instead of
+# re-running the LLM. Single-turn requests only - history changes intent.
+_ROUTE_CACHE = SemanticCache("route_cache", threshold=0.95)
+
 # Initialize OpenAI client
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-# Routing statistics (for analytics)
-ROUTING_STATS = {
-    "total_routes": 0,
-    "routes_by_agent": {
-        "orthopedic": 0,
-        "cardiology": 0,
-        "primary_care": 0,
-        "unclear": 0
-    },
-    "average_confidence": 0.0,
-    "last_reset": datetime.now().isoformat()
+# Async client for batch routing, created on first use
+_async_client: Optional[AsyncOpenAI] = None
+
+
+def _get_async_client() -> AsyncOpenAI:
+    """Get or create the shared async OpenAI client for batch routing."""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _async_client
+
+# Stable key for OpenAI's automatic prompt caching: the router prompt is
+# identical on every call, so one cache key shares the API-side KV cache
+# across all routing requests.
+PROMPT_CACHE_KEY = hashlib.sha256(ROUTER_AGENT_PROMPT.encode()).hexdigest()[:32]
+
+# Routing reasoning is kept for transparency but capped: returning the full
+# model output verbatim made eval runs hold thousands of ~300-token strings
+# and bloated JSON logs for no analytical value.
+ROUTE_REASONING_MAXLEN = int(os.getenv("ROUTE_REASONING_MAXLEN", "200"))
+
+# System message template built once: every routing call (and every message
+# in a batch) reuses the same dict instead of allocating a fresh one. It is
+# never mutated, so sharing by reference is safe.
+_SYS_MSG = {"role": "system", "content": ROUTER_AGENT_PROMPT}
+
+# Specialty keywords, hoisted to module level and compiled once: the
+# per-call version rebuilt three lists and ran ~25 Python-level substring
+# scans on every routing request.
+ORTHOPEDIC_KEYWORDS = ("knee", "hip", "joint", "bone", "fracture", "orthopedic",
+                       "sports injury", "arthritis", "surgery", "replacement")
+CARDIOLOGY_KEYWORDS = ("heart", "chest pain", "cardiology", "cardiac", "afib",
+                       "a-fib", "stress test", "pacemaker", "stent")
+PRIMARY_CARE_KEYWORDS = ("physical", "wellness", "checkup", "annual", "preventive",
+                         "diabetes", "hypertension", "blood pressure")
+
+KEYWORD_SPECIALTY = {
+    **{kw: "orthopedic" for kw in ORTHOPEDIC_KEYWORDS},
+    **{kw: "cardiology" for kw in CARDIOLOGY_KEYWORDS},
+    **{kw: "primary_care" for kw in PRIMARY_CARE_KEYWORDS},
 }
 
+# When pyahocorasick is installed all keywords are matched in one automaton
+# walk; otherwise a single precompiled alternation does one C-level scan.
+try:
+    import ahocorasick
+
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _kw, _specialty in KEYWORD_SPECIALTY.items():
+        _KEYWORD_AUTOMATON.add_word(_kw, (_kw, _specialty))
+    _KEYWORD_AUTOMATON.make_automaton()
+except ImportError:
+    _KEYWORD_AUTOMATON = None
+
+_KEYWORD_RE = re.compile("|".join(re.escape(k) for k in KEYWORD_SPECIALTY))
+
+
+def _detect_keywords(message_lower: str) -> List[str]:
+    """
+    Find all specialty keywords in a lowercased message in a single pass.
+
+    Returns:
+        Matched keywords, deduplicated, in order of first occurrence
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        matches = [kw for _, (kw, _) in _KEYWORD_AUTOMATON.iter(message_lower)]
+    else:
+        matches = _KEYWORD_RE.findall(message_lower)
+    return list(dict.fromkeys(matches))
+
+
+_POLICY_TERM_RE = re.compile(
+    r"\b(insurance|coverage|covered|referral|policy|medicare|medicaid|copay|"
+    r"authorization)\b",
+    re.IGNORECASE
+)
+
+
+def _should_use_rag(user_message: str) -> bool:
+    """
+    Decide whether a RAG lookup can improve the routing decision.
+
+    Retrieval only helps when the message is policy-laden or ambiguous;
+    trivially short messages and ones the keyword scan already understands
+    skip the vector-store roundtrip.
+    """
+    if len(user_message.split()) < 4:
+        return False
+    if _POLICY_TERM_RE.search(user_message) is not None:
+        return True
+    return not _detect_keywords(user_message.lower())
+
+
+def _keyword_fast_route(user_message: str) -> Optional[Dict[str, Any]]:
+    """
+    Deterministic routing for unambiguous keyword matches.
+
+    When a message hits two or more keywords that all belong to a single
+    specialty, the LLM adds no information - the routing decision is
+    returned directly, saving an API roundtrip. Zero matches or matches
+    spread across specialties fall through to the model.
+
+    Returns:
+        Routing result dict, or None when the LLM should decide
+    """
+    keywords = _detect_keywords(user_message.lower())
+    if not keywords:
+        return None
+
+    votes = Counter(KEYWORD_SPECIALTY[kw] for kw in keywords)
+    if len(votes) != 1:
+        return None
+
+    specialty, count = next(iter(votes.items()))
+    if count < 2:
+        return None
+
+    _record_route(specialty)
+
+    logger.info(f"Keyword fast path routed to {specialty} ({', '.join(keywords)})")
+    return {
+        "success": True,
+        "agent": specialty,
+        "confidence": "high",
+        "reasoning": f"Keyword-only fast path: {', '.join(keywords)} unambiguously indicate {specialty}",
+        "keywords_detected": keywords,
+        "rag_context_used": False,
+        "timestamp": datetime.now().isoformat(),
+        "tokens_used": 0
+    }
+
+
+# Routing statistics (for analytics). Counts live in a Counter guarded by
+# a lock: batch_route runs routing concurrently, and bare dict increments
+# are not atomic, so unguarded updates would lose counts under load.
+_AGENTS = ("orthopedic", "cardiology", "primary_care", "unclear")
+_stats_lock = threading.Lock()
+_route_counts = Counter()
+_stats_last_reset = datetime.now().isoformat()
+
+
+def _record_route(agent: str) -> None:
+    """Thread-safe increment of the per-agent routing count."""
+    with _stats_lock:
+        _route_counts[agent] += 1
+
 
 def route_patient(
     user_message: str,
@@ -80,109 +225,205 @@ def route_patient(
         'orthopedic'
     """
     try:
-        # Build conversation context
-        messages = []
-
-        # Add system prompt
-        system_prompt = ROUTER_AGENT_PROMPT
-
-        # Optionally add RAG context
-        rag_context_used = False
-        if use_rag and user_message:
-            try:
-                rag_results = retrieve_policies(user_message, n_results=2)
-                if rag_results:
-                    rag_context = "\n\n".join([
-                        f"Policy: {r['metadata'].get('title', 'Unknown')}\n{r['content'][:300]}..."
-                        for r in rag_results
-                    ])
-                    system_prompt += f"\n\nRELEVANT POLICIES:\n{rag_context}"
-                    rag_context_used = True
-            except Exception as e:
-                logger.warning(f"RAG retrieval failed: {e}")
-
-        messages.append({"role": "system", "content": system_prompt})
-
-        # Add conversation history
-        if conversation_history:
-            messages.extend(conversation_history[-5:])  # Last 5 messages for context
-
-        # Add current message
-        messages.append({"role": "user", "content": user_message})
+        # Unambiguous keyword hits skip the LLM entirely
+        fast_route = _keyword_fast_route(user_message)
+        if fast_route is not None:
+            return fast_route
+
+        # Near-duplicate phrasings reuse the cached routing decision
+        if not conversation_history:
+            cached = _ROUTE_CACHE.get(user_message)
+            if cached is not None:
+                # Cache hits are still routes; keep the statistics complete
+                _record_route(cached["agent"])
+                return dict(cached, cache_hit=True, timestamp=datetime.now().isoformat())
+
+        messages, rag_results = _build_routing_messages(
+            user_message, conversation_history, use_rag
+        )
 
         # Call OpenAI API
         response = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=messages,
             temperature=0.3,  # Lower temperature for consistent routing
-            max_tokens=300
+            max_tokens=300,
+            extra_body={"prompt_cache_key": PROMPT_CACHE_KEY}
+        )
+
+        result = _parse_routing_result(
+            user_message,
+            response.choices[0].message.content.strip(),
+            bool(rag_results),
+            response.usage.total_tokens
         )
+        # Specialty agents can reuse this retrieval instead of re-querying
+        result["rag_results"] = rag_results or []
 
-        # Parse response
-        routing_response = response.choices[0].message.content.strip()
-
-        # Extract routing decision (look for agent name in response)
-        agent = "unclear"
-        confidence = "medium"
-
-        routing_lower = routing_response.lower()
-
-        # Detect agent
-        if "orthopedic" in routing_lower:
-            agent = "orthopedic"
-        elif "cardiology" in routing_lower or "cardiac" in routing_lower:
-            agent = "cardiology"
-        elif "primary" in routing_lower or "primary care" in routing_lower:
-            agent = "primary_care"
-
-        # Detect confidence
-        if "high confidence" in routing_lower or "clearly" in routing_lower:
-            confidence = "high"
-        elif "low confidence" in routing_lower or "unclear" in routing_lower or "uncertain" in routing_lower:
-            confidence = "low"
-
-        # Extract keywords
-        keywords = []
-        orthopedic_keywords = ["knee", "hip", "joint", "bone", "fracture", "orthopedic",
-                              "sports injury", "arthritis", "surgery", "replacement"]
-        cardiology_keywords = ["heart", "chest pain", "cardiology", "cardiac", "afib",
-                              "a-fib", "stress test", "pacemaker", "stent"]
-        primary_keywords = ["physical", "wellness", "checkup", "annual", "preventive",
-                           "diabetes", "hypertension", "blood pressure"]
-
-        message_lower = user_message.lower()
-        for keyword in orthopedic_keywords + cardiology_keywords + primary_keywords:
-            if keyword in message_lower:
-                keywords.append(keyword)
-
-        # Update statistics
-        ROUTING_STATS["total_routes"] += 1
-        ROUTING_STATS["routes_by_agent"][agent] += 1
-
-        # Return routing decision
-        return {
-            "success": True,
-            "agent": agent,
-            "confidence": confidence,
-            "reasoning": routing_response,
-            "keywords_detected": keywords,
-            "rag_context_used": rag_context_used,
-            "timestamp": datetime.now().isoformat(),
-            "tokens_used": response.usage.total_tokens
-        }
+        if not conversation_history and result["success"]:
+            _ROUTE_CACHE.set(user_message, result)
+
+        return result
 
     except Exception as e:
-        logger.error(f"Routing error: {e}")
-        return {
-            "success": False,
-            "agent": "unclear",
-            "confidence": "low",
-            "reasoning": "Error during routing",
-            "error": str(e),
-            "keywords_detected": [],
-            "rag_context_used": False,
-            "timestamp": datetime.now().isoformat()
-        }
+        return _routing_error_result(e)
+
+
+def _build_routing_messages(
+    user_message: str,
+    conversation_history: Optional[List[Dict]],
+    use_rag: bool
+) -> tuple:
+    """
+    Build the messages list for a routing call.
+
+    The static router prompt stays byte-identical as messages[0] so the
+    cached prefix is shared; per-query RAG context goes in its own system
+    message after it.
+
+    Returns:
+        (messages, rag_results) tuple; rag_results is None when retrieval
+        was skipped or came back empty
+    """
+    # Optionally build the RAG system message
+    rag_message = None
+    rag_results = None
+    if use_rag and user_message and _should_use_rag(user_message):
+        try:
+            rag_results = retrieve_policies_cached(user_message, n_results=2)
+            if rag_results:
+                rag_context = "\n\n".join([
+                    f"Policy: {r['metadata'].get('title', 'Unknown')}\n{r['content'][:300]}..."
+                    for r in rag_results
+                ])
+                rag_message = {
+                    "role": "system",
+                    "content": f"RELEVANT POLICIES:\n{rag_context}"
+                }
+        except Exception as e:
+            logger.warning(f"RAG retrieval failed: {e}")
+
+    # Assemble in one list literal (last 5 history messages for context)
+    history = conversation_history[-5:] if conversation_history else ()
+    user_msg = {"role": "user", "content": user_message}
+    if rag_message is not None:
+        messages = [_SYS_MSG, rag_message, *history, user_msg]
+    else:
+        messages = [_SYS_MSG, *history, user_msg]
+
+    return messages, rag_results if rag_message is not None else None
+
+
+def _parse_routing_result(
+    user_message: str,
+    routing_response: str,
+    rag_context_used: bool,
+    tokens_used: int
+) -> Dict[str, Any]:
+    """Parse the model's routing response into the standard result dict."""
+    # Extract routing decision (look for agent name in response)
+    agent = "unclear"
+    confidence = "medium"
+
+    routing_lower = routing_response.lower()
+
+    # Detect agent
+    if "orthopedic" in routing_lower:
+        agent = "orthopedic"
+    elif "cardiology" in routing_lower or "cardiac" in routing_lower:
+        agent = "cardiology"
+    elif "primary" in routing_lower or "primary care" in routing_lower:
+        agent = "primary_care"
+
+    # Detect confidence
+    if "high confidence" in routing_lower or "clearly" in routing_lower:
+        confidence = "high"
+    elif "low confidence" in routing_lower or "unclear" in routing_lower or "uncertain" in routing_lower:
+        confidence = "low"
+
+    # Extract keywords in one scan over the message
+    keywords = _detect_keywords(user_message.lower())
+
+    # Update statistics
+    _record_route(agent)
+
+    # Return routing decision
+    return {
+        "success": True,
+        "agent": agent,
+        "confidence": confidence,
+        "reasoning": routing_response[:ROUTE_REASONING_MAXLEN],
+        "keywords_detected": keywords,
+        "rag_context_used": rag_context_used,
+        "timestamp": datetime.now().isoformat(),
+        "tokens_used": tokens_used
+    }
+
+
+def _routing_error_result(e: Exception) -> Dict[str, Any]:
+    """Standard error result shared by the sync and async routing paths."""
+    logger.error(f"Routing error: {e}")
+    return {
+        "success": False,
+        "agent": "unclear",
+        "confidence": "low",
+        "reasoning": "Error during routing",
+        "error": str(e),
+        "keywords_detected": [],
+        "rag_context_used": False,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+_MAX_ROUTE_RETRIES = 5
+
+
+async def _route_patient_async(
+    user_message: str,
+    semaphore: asyncio.Semaphore
+) -> Dict[str, Any]:
+    """
+    Async single-message routing used by batch_route.
+
+    Concurrency is bounded by the caller's semaphore to respect OpenAI
+    RPM/TPM limits, and 429s are retried with jittered exponential backoff.
+    """
+    async with semaphore:
+        try:
+            fast_route = _keyword_fast_route(user_message)
+            if fast_route is not None:
+                return fast_route
+
+            messages, rag_results = await asyncio.to_thread(
+                _build_routing_messages, user_message, None, True
+            )
+
+            for attempt in range(_MAX_ROUTE_RETRIES):
+                try:
+                    response = await _get_async_client().chat.completions.create(
+                        model="gpt-4o-mini",
+                        messages=messages,
+                        temperature=0.3,
+                        max_tokens=300,
+                        extra_body={"prompt_cache_key": PROMPT_CACHE_KEY}
+                    )
+                    break
+                except RateLimitError:
+                    if attempt == _MAX_ROUTE_RETRIES - 1:
+                        raise
+                    await asyncio.sleep(min(2 ** attempt, 30) + random.random())
+
+            result = _parse_routing_result(
+                user_message,
+                response.choices[0].message.content.strip(),
+                bool(rag_results),
+                response.usage.total_tokens
+            )
+            result["rag_results"] = rag_results or []
+            return result
+
+        except Exception as e:
+            return _routing_error_result(e)
 
 
 def route_with_fallback(
@@ -213,22 +454,27 @@ def route_with_fallback(
     return result
 
 
-def batch_route(messages: List[str]) -> List[Dict[str, Any]]:
+def batch_route(messages: List[str], max_concurrency: int = 20) -> List[Dict[str, Any]]:
     """
-    Route multiple messages in batch (useful for testing/evaluation).
+    Route multiple messages concurrently (useful for testing/evaluation).
+
+    Requests are multiplexed over the shared async client, bounded by a
+    semaphore so a large batch cannot blow through OpenAI rate limits.
 
     Args:
         messages: List of patient messages to route
+        max_concurrency: Maximum number of in-flight routing requests
 
     Returns:
-        List of routing results
+        List of routing results, in the same order as the input messages
     """
-    results = []
-    for message in messages:
-        result = route_patient(message)
-        results.append(result)
+    async def _run() -> List[Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        return list(await asyncio.gather(*[
+            _route_patient_async(message, semaphore) for message in messages
+        ]))
 
-    return results
+    return asyncio.run(_run())
 
 
 def get_routing_statistics() -> Dict[str, Any]:
@@ -242,29 +488,28 @@ def get_routing_statistics() -> Dict[str, Any]:
             - average_confidence
             - last_reset
     """
-    # Calculate average confidence
-    total = ROUTING_STATS["total_routes"]
-    if total > 0:
-        # This is simplified - in production you'd track actual confidence scores
-        ROUTING_STATS["average_confidence"] = 0.8  # Placeholder
+    with _stats_lock:
+        counts = dict(_route_counts)
+        last_reset = _stats_last_reset
 
-    return ROUTING_STATS.copy()
+    routes_by_agent = {agent: counts.get(agent, 0) for agent in _AGENTS}
+    total = sum(routes_by_agent.values())
+
+    return {
+        "total_routes": total,
+        "routes_by_agent": routes_by_agent,
+        # This is simplified - in production you'd track actual confidence scores
+        "average_confidence": 0.8 if total > 0 else 0.0,
+        "last_reset": last_reset
+    }
 
 
 def reset_routing_statistics():
     """Reset routing statistics (useful for testing)."""
-    global ROUTING_STATS
-    ROUTING_STATS = {
-        "total_routes": 0,
-        "routes_by_agent": {
-            "orthopedic": 0,
-            "cardiology": 0,
-            "primary_care": 0,
-            "unclear": 0
-        },
-        "average_confidence": 0.0,
-        "last_reset": datetime.now().isoformat()
-    }
+    global _stats_last_reset
+    with _stats_lock:
+        _route_counts.clear()
+        _stats_last_reset = datetime.now().isoformat()
 
 
 # Export public functions
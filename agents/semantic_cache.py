@@ -0,0 +1,129 @@
+"""
+Shared semantic cache for near-duplicate queries.
+
+Patients phrase the same request many ways ("knee pain after surgery" vs.
+"my knee hurts post-op"); routing decisions and RAG policy lookups for
+those paraphrases are identical. This module caches values keyed by query
+meaning: lookups run one local embedding (chroma's default all-MiniLM-L6-v2
+on CPU) and an in-memory ANN search instead of an API roundtrip.
+
+Cached values stay in-process in a plain dict keyed by query hash; the
+chroma collection only holds the query texts for similarity search, so
+arbitrary Python values (routing dicts, formatted context strings) can be
+cached without serialization.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    Near-duplicate query cache with TTL and capped size.
+
+    Entries expire after ttl_seconds and the cache holds at most
+    max_entries values, evicting the entry closest to expiry first.
+    All failures degrade to a cache miss - callers never see exceptions.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        threshold: float = 0.95,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 512
+    ):
+        """
+        Args:
+            name: Collection name (one cache per name per process)
+            threshold: Minimum cosine similarity for a hit
+            ttl_seconds: Entry lifetime
+            max_entries: Maximum number of cached values
+        """
+        self._name = name
+        self._threshold = threshold
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._collection = None
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _get_collection(self):
+        """Lazily create the in-memory chroma collection (cosine space)."""
+        if self._collection is None:
+            with self._lock:
+                if self._collection is None:
+                    import chromadb
+                    client = chromadb.EphemeralClient()
+                    self._collection = client.get_or_create_collection(
+                        name=self._name,
+                        metadata={"hnsw:space": "cosine"}
+                    )
+        return self._collection
+
+    def get(self, query: str) -> Optional[Any]:
+        """
+        Return the cached value for the nearest stored query, or None on a
+        miss (no neighbor above threshold, expired entry, or any error).
+        """
+        try:
+            collection = self._get_collection()
+            if collection.count() == 0:
+                return None
+
+            results = collection.query(query_texts=[query], n_results=1)
+            if not results["ids"][0]:
+                return None
+
+            similarity = 1.0 - results["distances"][0][0]
+            if similarity < self._threshold:
+                return None
+
+            cache_id = results["ids"][0][0]
+            entry = self._values.get(cache_id)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if time.monotonic() > expires_at:
+                self._evict(cache_id)
+                return None
+
+            logger.info(
+                f"Semantic cache hit on '{self._name}' (similarity={similarity:.3f})"
+            )
+            return value
+
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed on '{self._name}': {str(e)}")
+            return None
+
+    def set(self, query: str, value: Any) -> None:
+        """Cache a value under the query's embedding; errors are swallowed."""
+        try:
+            collection = self._get_collection()
+            cache_id = hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+            with self._lock:
+                if cache_id not in self._values and len(self._values) >= self._max_entries:
+                    oldest = min(self._values, key=lambda k: self._values[k][1])
+                    self._evict(oldest)
+
+                collection.upsert(ids=[cache_id], documents=[query])
+                self._values[cache_id] = (value, time.monotonic() + self._ttl)
+
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed on '{self._name}': {str(e)}")
+
+    def _evict(self, cache_id: str) -> None:
+        """Drop one entry from both the value dict and the collection."""
+        self._values.pop(cache_id, None)
+        try:
+            self._get_collection().delete(ids=[cache_id])
+        except Exception:
+            pass
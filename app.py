@@ -5,26 +5,18 @@ Multi-page app for AI-powered healthcare appointment scheduling.
 
 import streamlit as st
 import os
+import threading
 from dotenv import load_dotenv
-from rag import initialize_rag
 
 # Load environment variables
 load_dotenv()
 
-# Page configuration
-st.set_page_config(
-    page_title="BSW Health - AI Scheduling Assistant",
-    page_icon="",
-    layout="wide",
-    initial_sidebar_state="expanded",
-    menu_items={
-        'Get Help': 'https://www.bswhealth.com',
-        'About': "BSW Health AI Scheduling Agent - Demo System"
-    }
-)
+# Captured once at import; session-state seeding and status checks read this
+_OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
 
-# Custom CSS for healthcare-appropriate styling
-st.markdown("""
+# Custom CSS for healthcare-appropriate styling. Defined once as a module
+# constant so reruns reuse the same string object instead of rebuilding it.
+_BSW_CSS = """
 <style>
     /* Main theme colors - BSW brand colors */
     :root {
@@ -161,105 +153,15 @@ st.markdown("""
         margin-top: 3rem;
     }
 </style>
-""", unsafe_allow_html=True)
-
-# Initialize session state
-if 'initialized' not in st.session_state:
-    st.session_state.initialized = False
-    st.session_state.openai_api_key = os.getenv('OPENAI_API_KEY', '')
-    st.session_state.conversation_history = []
-    st.session_state.current_agent = 'router'
-    st.session_state.rag_initialized = False
-
-# Initialize RAG system if not already done
-if not st.session_state.rag_initialized:
-    try:
-        with st.spinner("Initializing healthcare policy database..."):
-            initialize_rag()
-            st.session_state.rag_initialized = True
-    except Exception as e:
-        st.error(f"Error initializing RAG system: {e}")
-
-# Sidebar
-with st.sidebar:
-    # Logo placeholder - using styled text instead of image
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #00447c 0%, #00a4e4 100%);
-                padding: 1.5rem; border-radius: 8px; text-align: center; margin-bottom: 1rem;">
-        <h2 style="color: white; margin: 0; font-size: 1.5rem;">BSW Health</h2>
-        <p style="color: rgba(255,255,255,0.8); margin: 0.25rem 0 0 0; font-size: 0.9rem;">AI Scheduling</p>
-    </div>
-    """, unsafe_allow_html=True)
-
-    st.markdown("---")
-
-    st.markdown("### Navigation")
-    st.markdown("""
-    - **Home** - Welcome and overview
-    - **Login** - Select demo patient
-    - **Chat** - Schedule appointments
-    - **Metrics Dashboard** - View analytics
-    - **Feedback** - Rate conversations
-    """)
-
-    st.markdown("---")
-
-    # API Key Status
-    st.markdown("### System Status")
-    if st.session_state.openai_api_key:
-        st.success("OpenAI API: Connected")
-    else:
-        st.warning("OpenAI API: Not configured")
-        st.markdown("Set `OPENAI_API_KEY` in `.env` file")
-
-    if st.session_state.rag_initialized:
-        st.success("RAG System: Ready")
-    else:
-        st.info("RAG System: Initializing...")
-
-    st.markdown("---")
-
-    # Quick Stats
-    st.markdown("### Quick Stats")
-    try:
-        from evaluation.metrics import get_metrics_tracker
-        tracker = get_metrics_tracker()
-
-        total_convs = len(tracker.conversations)
-        success_rate = tracker.get_success_rate()
-
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Total Chats", total_convs)
-        with col2:
-            st.metric("Success Rate", f"{success_rate:.0%}")
-    except:
-        st.info("No metrics available yet")
-
-    st.markdown("---")
-
-    # Important Notice
-    st.markdown("### Important Notice")
-    st.info("""
-    **Demo System**
-
-    This is a demonstration system using mock data.
-    No real patient information is processed or stored.
-
-    For real appointments, call:
-    **1-844-BSW-DOCS**
-    """)
+"""
 
-# Main content
-st.markdown("""
+# Static home-page HTML, allocated once at module scope and emitted with a
+# single st.markdown call per rerun.
+_HOME_INTRO_HTML = """
 <div class="main-header">
     <h1>Baylor Scott & White Health</h1>
     <p>AI-Powered Appointment Scheduling Assistant</p>
 </div>
-""", unsafe_allow_html=True)
-
-# Welcome message
-st.markdown("""
 <div class="info-card">
     <h3>Welcome to BSW Health's AI Scheduling Assistant</h3>
     <p>
@@ -268,15 +170,11 @@ st.markdown("""
         for Orthopedics, Cardiology, and Primary Care.
     </p>
 </div>
-""", unsafe_allow_html=True)
-
-# Feature highlights
-st.markdown("## Key Features")
-
-col1, col2, col3 = st.columns(3)
+"""
 
-with col1:
-    st.markdown("""
+# Key Features cards, one HTML constant per column
+_FEATURE_CARDS_HTML = (
+    """
     <div class="feature-item">
         <div class="feature-icon"></div>
         <div class="feature-title">Multi-Agent Intelligence</div>
@@ -285,10 +183,8 @@ with col1:
             Orthopedic, Cardiology, and Primary Care experts at your service.
         </div>
     </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("""
+    """,
+    """
     <div class="feature-item">
         <div class="feature-icon"></div>
         <div class="feature-title">RAG-Enhanced Policies</div>
@@ -297,10 +193,8 @@ with col2:
             to provide accurate, policy-compliant guidance.
         </div>
     </div>
-    """, unsafe_allow_html=True)
-
-with col3:
-    st.markdown("""
+    """,
+    """
     <div class="feature-item">
         <div class="feature-icon"></div>
         <div class="feature-title">Smart Function Calling</div>
@@ -309,94 +203,296 @@ with col3:
             search appointment slots, and book appointments seamlessly.
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """,
+)
 
-# How it works
-st.markdown("## How It Works")
+# Demo scenario cards, two per column
+_DEMO_SCENARIOS_MD = (
+    ("""
+    ### Orthopedic Follow-up
+    **Patient**: Sarah Martinez (PT001)
 
-with st.expander("1. Start a Conversation", expanded=False):
-    st.markdown("""
+    "I had knee replacement surgery 2 weeks ago with Dr. Martinez and need to schedule
+    my follow-up appointment."
+
+    *Demonstrates*: Post-op protocols, provider matching, clinical scheduling
+    """, """
+    ### Annual Wellness Visit
+    **Patient**: Michael Thompson (PT004)
+
+    "I need to schedule my annual physical exam with my primary care doctor."
+
+    *Demonstrates*: Preventive care scheduling, insurance coverage, routine appointments
+    """),
+    ("""
+    ### Cardiology Consultation
+    **Patient**: James Wilson (PT002)
+
+    "I've been having chest pain and my PCP referred me to cardiology for evaluation."
+
+    *Demonstrates*: Urgency assessment, referral verification, Medicare coverage
+    """, """
+    ### Complex Rescheduling
+    **Patient**: Lisa Chen (PT003)
+
+    "I need to reschedule my appointment with Dr. Kim due to a conflict."
+
+    *Demonstrates*: Appointment management, provider preferences, constraint satisfaction
+    """),
+)
+
+_FOOTER_HTML = """
+<div class="footer">
+    <p><strong>Baylor Scott & White Health - AI Scheduling Agent Demo</strong></p>
+    <p>Developed by <strong>Joslyn Cavitt</strong> | <a href="mailto:joslyncavitt@gmail.com">joslyncavitt@gmail.com</a></p>
+    <p>Created for BSW Health Interview | October 2025</p>
+    <p>Tech Stack: Python 3.11 | Streamlit | OpenAI GPT-4o-mini | ChromaDB</p>
+    <p style="margin-top: 1rem; font-size: 0.85rem; color: #999;">
+        This is a demonstration system using mock data only. No real patient information is stored or processed.
+    </p>
+</div>
+"""
+
+# Static "How It Works" content, built once at module scope and rendered
+# in a loop rather than four hand-rolled expander blocks.
+_HOW_IT_WORKS_STEPS = (
+    ("1. Start a Conversation", """
     Navigate to the **Chat** page and describe your appointment needs in natural language.
 
     Examples:
     - "I need a follow-up for my knee replacement surgery"
     - "I'm having chest pain and need to see a cardiologist"
     - "I'd like to schedule my annual physical exam"
-    """)
-
-with st.expander("2. Intelligent Routing", expanded=False):
-    st.markdown("""
+    """),
+    ("2. Intelligent Routing", """
     Our Router Agent analyzes your request and automatically directs you to the appropriate specialist agent:
 
     - **Orthopedic Agent**: Joint pain, sports injuries, bone/muscle issues, post-op follow-ups
     - **Cardiology Agent**: Heart-related concerns, chest pain, cardiovascular conditions
     - **Primary Care Agent**: General health, wellness exams, preventive care, routine checkups
-    """)
-
-with st.expander("3. Policy-Aware Assistance", expanded=False):
-    st.markdown("""
+    """),
+    ("3. Policy-Aware Assistance", """
     The specialist agent checks relevant policies and requirements:
 
     - Insurance coverage verification and copay information
     - Referral requirements based on your insurance plan
     - Clinical scheduling protocols for your condition
     - Provider availability and specialty matching
-    """)
-
-with st.expander("4. Seamless Booking", expanded=False):
-    st.markdown("""
+    """),
+    ("4. Seamless Booking", """
     The agent helps you:
 
     - Find available providers matching your criteria
     - Search appointment slots based on your preferences
     - Verify insurance coverage and referral status
     - Book your appointment with instant confirmation
-    """)
+    """),
+)
 
-# Demo scenarios
-st.markdown("## Try These Demo Scenarios")
 
-scenarios_col1, scenarios_col2 = st.columns(2)
+@st.cache_resource(show_spinner="Initializing healthcare policy database...")
+def _get_rag():
+    """Build the process-global RAG handle exactly once.
 
-with scenarios_col1:
-    st.markdown("""
-    ### Orthopedic Follow-up
-    **Patient**: Sarah Martinez (PT001)
+    The Chroma store and embedding model are process-global, so caching
+    with st.cache_resource shares one instance across all sessions and
+    reruns instead of re-initializing per browser session.
+    """
+    from rag import initialize_rag
+    return initialize_rag()
 
-    "I had knee replacement surgery 2 weeks ago with Dr. Martinez and need to schedule
-    my follow-up appointment."
 
-    *Demonstrates*: Post-op protocols, provider matching, clinical scheduling
-    """)
+def _prewarm_rag():
+    """Warm the RAG stack off the main thread.
 
-    st.markdown("""
-    ### Annual Wellness Visit
-    **Patient**: Michael Thompson (PT004)
+    Initializes the vector store and runs one throwaway retrieval so the
+    embedding model's load and first forward pass happen before the first
+    real query. Works on the process-global rag singleton directly rather
+    than _get_rag(), since cached functions need a script context that
+    background threads lack.
+    """
+    try:
+        from rag import initialize_rag, retrieve_policies
+        initialize_rag()
+        retrieve_policies("warmup", n_results=1)
+    except Exception:
+        pass
 
-    "I need to schedule my annual physical exam with my primary care doctor."
 
-    *Demonstrates*: Preventive care scheduling, insurance coverage, routine appointments
-    """)
+@st.cache_resource
+def _start_prewarm():
+    """Spawn the prewarm thread exactly once per process.
+
+    Streamlit re-executes this script on every rerun, so the spawn has to
+    live behind st.cache_resource — otherwise each widget interaction
+    would launch another warmup retrieval.
+    """
+    thread = threading.Thread(target=_prewarm_rag, daemon=True)
+    thread.start()
+    return thread
+
+
+if os.getenv("BSW_PREWARM", "1") == "1":
+    _start_prewarm()
+
+
+@st.cache_resource
+def _get_metrics_tracker():
+    """Import and build the metrics tracker once per process.
+
+    The evaluation package drags in heavy transitive imports; keeping the
+    import inside a cached function means reruns skip it entirely.
+    """
+    from evaluation.metrics import get_metrics_tracker
+    return get_metrics_tracker()
+
+
+@st.cache_data(ttl=5)
+def _quick_stats(n_convs: int):
+    """Sidebar stats, cached per conversation count.
+
+    Keyed on the number of logged conversations so reruns during typing
+    and widget interaction skip the O(N) success-rate scan; the short TTL
+    keeps the panel fresh even if the count key ever goes stale.
+    """
+    tracker = _get_metrics_tracker()
+    return n_convs, tracker.get_success_rate()
+
 
-with scenarios_col2:
+@st.fragment(run_every=30)
+def _sidebar_stats():
+    """Sidebar Quick Stats, isolated in a fragment.
+
+    Main-page interactions rerun only this function's output region, not
+    the whole script; run_every keeps the numbers fresh without user
+    interaction.
+    """
+    st.markdown("### Quick Stats")
+    try:
+        tracker = _get_metrics_tracker()
+
+        total_convs, success_rate = _quick_stats(len(tracker.conversations))
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total Chats", total_convs)
+        with col2:
+            st.metric("Success Rate", f"{success_rate:.0%}")
+    except (ImportError, AttributeError):
+        st.info("No metrics available yet")
+
+# Page configuration
+st.set_page_config(
+    page_title="BSW Health - AI Scheduling Assistant",
+    page_icon="",
+    layout="wide",
+    initial_sidebar_state="expanded",
+    menu_items={
+        'Get Help': 'https://www.bswhealth.com',
+        'About': "BSW Health AI Scheduling Agent - Demo System"
+    }
+)
+
+st.markdown(_BSW_CSS, unsafe_allow_html=True)
+
+# Initialize session state (setdefault keeps existing values on reruns)
+for _key, _default in (
+    ('initialized', False),
+    ('openai_api_key', _OPENAI_API_KEY),
+    ('conversation_history', []),
+    ('current_agent', 'router'),
+    ('rag_initialized', False),
+):
+    st.session_state.setdefault(_key, _default)
+
+# Initialize RAG system (cached resource - built once per process)
+try:
+    _get_rag()
+    st.session_state.rag_initialized = True
+except Exception as e:
+    st.error(f"Error initializing RAG system: {e}")
+
+# Sidebar
+with st.sidebar:
+    # Logo placeholder - using styled text instead of image
     st.markdown("""
-    ### Cardiology Consultation
-    **Patient**: James Wilson (PT002)
+    <div style="background: linear-gradient(135deg, #00447c 0%, #00a4e4 100%);
+                padding: 1.5rem; border-radius: 8px; text-align: center; margin-bottom: 1rem;">
+        <h2 style="color: white; margin: 0; font-size: 1.5rem;">BSW Health</h2>
+        <p style="color: rgba(255,255,255,0.8); margin: 0.25rem 0 0 0; font-size: 0.9rem;">AI Scheduling</p>
+    </div>
+    """, unsafe_allow_html=True)
 
-    "I've been having chest pain and my PCP referred me to cardiology for evaluation."
+    st.markdown("---")
 
-    *Demonstrates*: Urgency assessment, referral verification, Medicare coverage
+    st.markdown("### Navigation")
+    st.markdown("""
+    - **Home** - Welcome and overview
+    - **Login** - Select demo patient
+    - **Chat** - Schedule appointments
+    - **Metrics Dashboard** - View analytics
+    - **Feedback** - Rate conversations
     """)
 
-    st.markdown("""
-    ### Complex Rescheduling
-    **Patient**: Lisa Chen (PT003)
+    st.markdown("---")
 
-    "I need to reschedule my appointment with Dr. Kim due to a conflict."
+    # API Key Status
+    st.markdown("### System Status")
+    if st.session_state.openai_api_key:
+        st.success("OpenAI API: Connected")
+    else:
+        st.warning("OpenAI API: Not configured")
+        st.markdown("Set `OPENAI_API_KEY` in `.env` file")
 
-    *Demonstrates*: Appointment management, provider preferences, constraint satisfaction
+    if st.session_state.rag_initialized:
+        st.success("RAG System: Ready")
+    else:
+        st.info("RAG System: Initializing...")
+
+    st.markdown("---")
+
+    # Quick Stats
+    _sidebar_stats()
+
+    st.markdown("---")
+
+    # Important Notice
+    st.markdown("### Important Notice")
+    st.info("""
+    **Demo System**
+
+    This is a demonstration system using mock data.
+    No real patient information is processed or stored.
+
+    For real appointments, call:
+    **1-844-BSW-DOCS**
     """)
 
+# Main content: header + welcome card (one emission of the static blob)
+st.markdown(_HOME_INTRO_HTML, unsafe_allow_html=True)
+
+# Feature highlights
+st.markdown("## Key Features")
+
+for _col, _card in zip(st.columns(3), _FEATURE_CARDS_HTML):
+    with _col:
+        st.markdown(_card, unsafe_allow_html=True)
+
+# How it works
+st.markdown("## How It Works")
+
+for _step_title, _step_body in _HOW_IT_WORKS_STEPS:
+    with st.expander(_step_title, expanded=False):
+        st.markdown(_step_body)
+
+# Demo scenarios
+st.markdown("## Try These Demo Scenarios")
+
+for _col, _cards in zip(st.columns(2), _DEMO_SCENARIOS_MD):
+    with _col:
+        for _card in _cards:
+            st.markdown(_card)
+
 # Technology stack
 with st.expander("Technology Stack & Architecture"):
     st.markdown("""
@@ -445,14 +541,4 @@ with col4:
         st.info("Navigate to Chat page to try demo scenarios")
 
 # Footer
-st.markdown("""
-<div class="footer">
-    <p><strong>Baylor Scott & White Health - AI Scheduling Agent Demo</strong></p>
-    <p>Developed by <strong>Joslyn Cavitt</strong> | <a href="mailto:joslyncavitt@gmail.com">joslyncavitt@gmail.com</a></p>
-    <p>Created for BSW Health Interview | October 2025</p>
-    <p>Tech Stack: Python 3.11 | Streamlit | OpenAI GPT-4o-mini | ChromaDB</p>
-    <p style="margin-top: 1rem; font-size: 0.85rem; color: #999;">
-        This is a demonstration system using mock data only. No real patient information is stored or processed.
-    </p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
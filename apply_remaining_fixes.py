@@ -5,41 +5,46 @@ Apply remaining prompt fixes for appointment search and provider explanations.
 
 import re
 
-# Fix 1: Update cardiology search_slots description
-def fix_cardiology_search(content):
-    old = '''**search_slots(provider_id, date_range, appointment_type, time_preference)**
+# Fixes 1 & 2: update the cardiology and primary care search_slots
+# descriptions. Kept as (old, new) pairs and applied in one multi-pattern
+# pass so the source is scanned once instead of once per fix.
+_PATCHES = [
+    (
+        '''**search_slots(provider_id, date_range, appointment_type, time_preference)**
 - Search for available appointment slots
 - Parameters: provider_id, date_range, appointment_type ("New Patient" or "Follow-up"), time_preference
 - Returns: Available appointments
-- Note: Cardiology slots are typically 45 minutes'''
-
-    new = '''**search_slots(provider_id, date_range, appointment_type, time_preference)**
+- Note: Cardiology slots are typically 45 minutes''',
+        '''**search_slots(provider_id, date_range, appointment_type, time_preference)**
 - Search for available appointment slots
 - Parameters: provider_id, date_range, appointment_type (MUST match specific type: "Heart Failure Follow-up", "A-fib Management", "New Patient Consultation", etc.), time_preference
 - Returns: Available appointments
 - **CRITICAL**: If patient specifies appointment type, ONLY return that exact type
 - **CRITICAL**: If no slots in 2 weeks, search 4 weeks and present ACTUAL next available
-- Note: Cardiology slots are typically 45 minutes'''
-
-    return content.replace(old, new)
-
-# Fix 2: Update primary care search_slots description
-def fix_primary_search(content):
-    old = '''**search_slots(provider_id, date_range, appointment_type, time_preference)**
+- Note: Cardiology slots are typically 45 minutes''',
+    ),
+    (
+        '''**search_slots(provider_id, date_range, appointment_type, time_preference)**
 - Search for available appointment slots
 - Parameters: provider_id, date_range, appointment_type ("New Patient" or "Follow-up"), time_preference
 - Returns: Available appointments
-- Note: Primary care slots are typically 20-30 minutes'''
-
-    new = '''**search_slots(provider_id, date_range, appointment_type, time_preference)**
+- Note: Primary care slots are typically 20-30 minutes''',
+        '''**search_slots(provider_id, date_range, appointment_type, time_preference)**
 - Search for available appointment slots
 - Parameters: provider_id, date_range, appointment_type (MUST match specific type: "Annual Wellness Visit", "Sick Visit", "Chronic Disease Management", etc.), time_preference
 - Returns: Available appointments
 - **CRITICAL**: If patient specifies appointment type, ONLY return that exact type
 - **CRITICAL**: If no slots in 2 weeks, search 4 weeks and present ACTUAL next available
-- Note: Primary care slots are typically 20-30 minutes'''
+- Note: Primary care slots are typically 20-30 minutes''',
+    ),
+]
 
-    return content.replace(old, new)
+_PATCH_RE = re.compile("|".join(re.escape(old) for old, _ in _PATCHES))
+_PATCH_MAP = dict(_PATCHES)
+
+def apply_patches(content):
+    """Apply all literal (old, new) patches in a single scan."""
+    return _PATCH_RE.sub(lambda m: _PATCH_MAP[m.group(0)], content)
 
 # Fix 3: Add provider specialty explanation rule (for all three agents)
 def add_provider_explanation_rule(content):
@@ -48,11 +53,10 @@ def add_provider_explanation_rule(content):
    Example: "Dr. Sarah Williams is a foot and ankle orthopedic surgeon" or "Dr. Michael Patel is an interventional cardiologist"
 '''
 
-    # Find all instances of the hallucination rules and add this as rule #7
-    pattern = r'(6\. Only present appointment information that comes directly from tool responses)'
-    replacement = r'\1\n' + rule_to_add
-
-    return re.sub(pattern, replacement, content)
+    # The anchor is a fixed string, so a literal replace patches every
+    # occurrence without regex-engine overhead
+    anchor = '6. Only present appointment information that comes directly from tool responses'
+    return content.replace(anchor, anchor + '\n' + rule_to_add)
 
 def main():
     print("Applying remaining prompt fixes...")
@@ -63,13 +67,10 @@ def main():
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    print("1. Fixing cardiology search_slots description...")
-    content = fix_cardiology_search(content)
-
-    print("2. Fixing primary care search_slots description...")
-    content = fix_primary_search(content)
+    print("1. Fixing cardiology and primary care search_slots descriptions...")
+    content = apply_patches(content)
 
-    print("3. Adding provider specialty explanation rule...")
+    print("2. Adding provider specialty explanation rule...")
     content = add_provider_explanation_rule(content)
 
     with open(filepath, 'w', encoding='utf-8') as f:
@@ -3,50 +3,14 @@ BSW Scheduling Agent - Evaluation System
 
 Comprehensive evaluation framework for testing multi-agent healthcare scheduling system.
 Includes test scenarios, metrics tracking, and dashboard data generation.
-"""
 
-from evaluation.scenarios import (
-    TestScenario,
-    SuccessCriteria,
-    TestObjectives,
-    ScenarioResult,
-    ALL_SCENARIOS,
-    SCENARIO_1_ORTHOPEDIC_FOLLOWUP,
-    SCENARIO_2_CARDIOLOGY_NEW_PATIENT,
-    SCENARIO_3_COMPLEX_RESCHEDULING,
-    SCENARIO_4_PRIMARY_CARE_WELLNESS,
-    run_scenario,
-    run_all_scenarios,
-    get_scenario_by_id,
-    get_scenarios_by_tag,
-    get_scenarios_by_difficulty,
-    export_results_to_json
-)
+Submodules are imported lazily (PEP 562): `import evaluation` stays cheap,
+and scenarios/metrics only load on first attribute access.
+"""
 
-from evaluation.metrics import (
-    ConversationMetrics,
-    ToolUsageMetrics,
-    LatencyMetrics,
-    TokenMetrics,
-    AgentPerformanceMetrics,
-    TaskSuccessMetrics,
-    calculate_conversation_score,
-    get_detailed_conversation_metrics,
-    track_tool_usage,
-    get_detailed_tool_metrics,
-    measure_latency,
-    get_detailed_latency_metrics,
-    estimate_tokens,
-    calculate_token_metrics,
-    evaluate_task_success,
-    calculate_agent_performance,
-    compare_agent_performance,
-    generate_dashboard_data,
-    export_dashboard_data
-)
+import importlib
 
-__all__ = [
-    # Scenarios
+_SCENARIO_EXPORTS = (
     "TestScenario",
     "SuccessCriteria",
     "TestObjectives",
@@ -57,13 +21,16 @@ __all__ = [
     "SCENARIO_3_COMPLEX_RESCHEDULING",
     "SCENARIO_4_PRIMARY_CARE_WELLNESS",
     "run_scenario",
+    "run_scenario_async",
     "run_all_scenarios",
+    "run_all_scenarios_async",
     "get_scenario_by_id",
     "get_scenarios_by_tag",
     "get_scenarios_by_difficulty",
     "export_results_to_json",
+)
 
-    # Metrics
+_METRICS_EXPORTS = (
     "ConversationMetrics",
     "ToolUsageMetrics",
     "LatencyMetrics",
@@ -82,8 +49,28 @@ __all__ = [
     "calculate_agent_performance",
     "compare_agent_performance",
     "generate_dashboard_data",
-    "export_dashboard_data"
-]
+    "export_dashboard_data",
+)
+
+# Which submodule provides each exported name
+_SUBMODULE = {name: "evaluation.scenarios" for name in _SCENARIO_EXPORTS}
+_SUBMODULE.update({name: "evaluation.metrics" for name in _METRICS_EXPORTS})
+
+__all__ = [*_SCENARIO_EXPORTS, *_METRICS_EXPORTS]
 
 __version__ = "1.0.0"
 __author__ = "BSW Health AI Team"
+
+
+def __getattr__(name):
+    """Resolve exported names on first access and cache them in globals()."""
+    module_name = _SUBMODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -6,13 +6,86 @@ tool usage analytics, latency monitoring, and per-agent performance comparison.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from collections import Counter, defaultdict
+from operator import itemgetter
+import statistics
 import time
 import json
 import re
 
+# Word tokenizer, compiled once; used by the relevance scorer on every turn
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Scoring patterns, compiled once at import time so the _score_* helpers
+# don't recompile them for every assistant message
+# The literal helpfulness terms are checked with `in`; the regex engine
+# is only invoked for the patterns that actually need it
+_HELPFUL_LITERALS = (
+    'appointment',
+    'confirmed',
+    'available',
+    'insurance',
+    'copay'
+)
+
+_HELPFUL_PATTERNS = [re.compile(p) for p in (
+    r'\d{1,2}:\d{2}',  # Times
+    r'\d{4}-\d{2}-\d{2}',  # Dates
+    r'dr\.?\s+\w+',  # Doctor names
+    r'\$\d+',  # Costs
+)]
+
+_NATURAL_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\b(hi|hello|thanks|thank you|please)\b',
+    r'\b(great|perfect|wonderful|excellent)\b',
+    r'\?',  # Questions
+    r'!',  # Exclamations
+)]
+
+_ROBOTIC_PATTERNS = [re.compile(p) for p in (
+    r'^\s*error:',
+    r'^\s*warning:',
+    r'\{.*\}',  # JSON-like responses
+    r'^\s*\[.*\]'  # Array-like responses
+)]
+
+# Every literal indicator evaluate_task_success looks for, folded into one
+# alternation so the joined conversation text is scanned once instead of
+# once per criterion list. Longest-first so multi-word indicators win.
+_TASK_INDICATORS = (
+    "confirmed", "scheduled", "booked", "appointment set",  # appointment_booked
+    "orthopedic", "cardiology", "primary care",  # correct_specialty_identified
+    "insurance",  # insurance_verified
+    "referral",  # referral_checked
+    "dr.", "doctor", "provider",  # provider_matched_preferences
+    "urgent", "asap", "soon", "emergency", "priority",  # appropriate_urgency
+)
+
+_TASK_INDICATOR_RE = re.compile("|".join(
+    re.escape(term)
+    for term in sorted(_TASK_INDICATORS, key=len, reverse=True)
+))
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is in requirements
+    np = None
+
+# Vectorize latency reductions above this turn count; shorter transcripts
+# are faster in plain Python than through array conversion
+_NUMPY_LATENCY_MIN_TURNS = 32
+
+# Same threshold idea for dashboard aggregation, per result set
+_NUMPY_AGG_MIN_RESULTS = 32
+
 
 @dataclass
 class ConversationMetrics:
@@ -181,24 +254,79 @@ def calculate_conversation_score(conversation: List[Dict]) -> float:
     Returns:
         Overall conversation quality score (0-1)
     """
+    # Key on the fields the scorers read so repeated conversations
+    # (regression runs, replays) hit the cache instead of re-running
+    # the full scoring pipeline
+    try:
+        key = tuple(
+            (msg.get("role"), msg.get("content", ""), tuple(msg.get("tools_used") or ()))
+            for msg in conversation
+        )
+        return _cached_conversation_score(key)
+    except TypeError:  # unhashable turn data; score without caching
+        return _score_conversation(conversation)
+
+
+@lru_cache(maxsize=4096)
+def _cached_conversation_score(key: tuple) -> float:
+    """Score a conversation reconstructed from its cache key."""
+    return _score_conversation([
+        {"role": role, "content": content, "tools_used": list(tools_used)}
+        for role, content, tools_used in key
+    ])
+
+
+class _PreparedTurn:
+    """One conversation turn with the derived views the scorers share.
+
+    Lowercasing, word splitting and keyword extraction happen once here
+    instead of once per _score_* helper.
+    """
+
+    __slots__ = ("role", "content", "lower", "word_count", "keywords", "has_tools")
+
+    def __init__(self, msg: Dict):
+        self.role = msg.get("role")
+        self.content = msg.get("content", "")
+        self.lower = self.content.lower()
+        self.word_count = len(self.lower.split())
+        self.keywords = frozenset(_WORD_RE.findall(self.lower))
+        self.has_tools = bool(msg.get("tools_used"))
+
+
+def _prepare(conversation: List[Dict]) -> List["_PreparedTurn"]:
+    """Tokenize each turn once for reuse across all scorers."""
+    return [_PreparedTurn(msg) for msg in conversation]
+
+
+def _score_conversation(conversation: List[Dict]) -> float:
+    """Run the component scorers and compose the overall score."""
     if not conversation or len(conversation) < 2:
         return 0.0
 
-    # Extract assistant messages
-    assistant_messages = [
-        msg for msg in conversation
-        if msg.get("role") == "assistant"
-    ]
+    turns = _prepare(conversation)
+
+    # Extract assistant turns
+    assistant_turns = [t for t in turns if t.role == "assistant"]
 
-    if not assistant_messages:
+    if not assistant_turns:
         return 0.0
 
-    # Component scores
-    relevance = _score_relevance(conversation)
-    helpfulness = _score_helpfulness(assistant_messages)
-    accuracy = _score_accuracy(assistant_messages)
-    naturalness = _score_naturalness(assistant_messages)
+    return _compose_score(
+        _score_relevance(turns),
+        _score_helpfulness(assistant_turns),
+        _score_accuracy(assistant_turns),
+        _score_naturalness(assistant_turns)
+    )
 
+
+def _compose_score(
+    relevance: float,
+    helpfulness: float,
+    accuracy: float,
+    naturalness: float
+) -> float:
+    """Combine component scores into the weighted overall score."""
     # Weighted average (can be tuned)
     weights = {
         "relevance": 0.30,
@@ -217,9 +345,9 @@ def calculate_conversation_score(conversation: List[Dict]) -> float:
     return round(overall, 3)
 
 
-def _score_relevance(conversation: List[Dict]) -> float:
+def _score_relevance(turns: List["_PreparedTurn"]) -> float:
     """Score how relevant agent responses are to user queries."""
-    if len(conversation) < 2:
+    if len(turns) < 2:
         return 0.0
 
     relevant_indicators = [
@@ -230,14 +358,13 @@ def _score_relevance(conversation: List[Dict]) -> float:
     score = 0.0
     pairs = 0
 
-    for i in range(len(conversation) - 1):
-        if conversation[i].get("role") == "user":
-            user_msg = conversation[i].get("content", "").lower()
-            agent_msg = conversation[i + 1].get("content", "").lower()
+    for i in range(len(turns) - 1):
+        if turns[i].role == "user":
+            agent_msg = turns[i + 1].lower
 
             # Check if agent response mentions keywords from user message
-            user_keywords = set(re.findall(r'\b\w+\b', user_msg))
-            agent_keywords = set(re.findall(r'\b\w+\b', agent_msg))
+            user_keywords = turns[i].keywords
+            agent_keywords = turns[i + 1].keywords
 
             overlap = len(user_keywords & agent_keywords)
             relevance_ratio = overlap / max(len(user_keywords), 1)
@@ -254,54 +381,45 @@ def _score_relevance(conversation: List[Dict]) -> float:
     return score / max(pairs, 1)
 
 
-def _score_helpfulness(assistant_messages: List[Dict]) -> float:
+def _score_helpfulness(assistant_turns: List["_PreparedTurn"]) -> float:
     """Score how helpful agent responses are."""
-    if not assistant_messages:
+    if not assistant_turns:
         return 0.0
 
-    helpful_indicators = [
-        r'\d{1,2}:\d{2}',  # Times
-        r'\d{4}-\d{2}-\d{2}',  # Dates
-        r'dr\.?\s+\w+',  # Doctor names
-        r'\$\d+',  # Costs
-        r'appointment',
-        r'confirmed',
-        r'available',
-        r'insurance',
-        r'copay'
-    ]
-
     total_score = 0.0
 
-    for msg in assistant_messages:
-        content = msg.get("content", "").lower()
+    for turn in assistant_turns:
+        content = turn.lower
         msg_score = 0.0
 
-        # Check for specific, actionable information
-        for pattern in helpful_indicators:
-            if re.search(pattern, content):
+        # Check for specific, actionable information; plain substring
+        # tests first, the regex engine only for the real patterns
+        for term in _HELPFUL_LITERALS:
+            if term in content:
+                msg_score += 0.15
+        for pattern in _HELPFUL_PATTERNS:
+            if pattern.search(content):
                 msg_score += 0.15
 
         # Length penalty: Too short may not be helpful
-        word_count = len(content.split())
-        if word_count < 10:
+        if turn.word_count < 10:
             msg_score *= 0.5
-        elif word_count > 100:
+        elif turn.word_count > 100:
             msg_score *= 0.9  # Slight penalty for verbosity
 
         total_score += min(1.0, msg_score)
 
-    return total_score / len(assistant_messages)
+    return total_score / len(assistant_turns)
 
 
-def _score_accuracy(assistant_messages: List[Dict]) -> float:
+def _score_accuracy(assistant_turns: List["_PreparedTurn"]) -> float:
     """
     Score factual accuracy of agent responses.
 
     In a real system, this would verify against ground truth.
     For now, we check for hallucination indicators and consistency.
     """
-    if not assistant_messages:
+    if not assistant_turns:
         return 0.0
 
     # Indicators of potential inaccuracy
@@ -318,8 +436,8 @@ def _score_accuracy(assistant_messages: List[Dict]) -> float:
 
     total_score = 0.0
 
-    for msg in assistant_messages:
-        content = msg.get("content", "").lower()
+    for turn in assistant_turns:
+        content = turn.lower
         msg_score = 0.7  # Start with baseline
 
         # Penalize uncertainty
@@ -335,50 +453,36 @@ def _score_accuracy(assistant_messages: List[Dict]) -> float:
         msg_score += (confidence_count * 0.1)
 
         # Check if tools were used (indicates data lookup)
-        if msg.get("tools_used"):
+        if turn.has_tools:
             msg_score += 0.2
 
         total_score += max(0.0, min(1.0, msg_score))
 
-    return total_score / len(assistant_messages)
+    return total_score / len(assistant_turns)
 
 
-def _score_naturalness(assistant_messages: List[Dict]) -> float:
+def _score_naturalness(assistant_turns: List["_PreparedTurn"]) -> float:
     """Score how natural and conversational the responses are."""
-    if not assistant_messages:
+    if not assistant_turns:
         return 0.0
 
-    natural_indicators = [
-        r'\b(hi|hello|thanks|thank you|please)\b',
-        r'\b(great|perfect|wonderful|excellent)\b',
-        r'\?',  # Questions
-        r'!',  # Exclamations
-    ]
-
-    robotic_indicators = [
-        r'^\s*error:',
-        r'^\s*warning:',
-        r'\{.*\}',  # JSON-like responses
-        r'^\s*\[.*\]'  # Array-like responses
-    ]
-
     total_score = 0.0
 
-    for msg in assistant_messages:
-        content = msg.get("content", "")
+    for turn in assistant_turns:
+        content = turn.content
         msg_score = 0.5  # Baseline
 
         # Check for natural language indicators
         natural_count = sum(
-            1 for pattern in natural_indicators
-            if re.search(pattern, content, re.IGNORECASE)
+            1 for pattern in _NATURAL_PATTERNS
+            if pattern.search(content)
         )
         msg_score += (natural_count * 0.1)
 
         # Penalize robotic responses
         robotic_count = sum(
-            1 for pattern in robotic_indicators
-            if re.search(pattern, content)
+            1 for pattern in _ROBOTIC_PATTERNS
+            if pattern.search(content)
         )
         msg_score -= (robotic_count * 0.3)
 
@@ -389,7 +493,7 @@ def _score_naturalness(assistant_messages: List[Dict]) -> float:
 
         total_score += max(0.0, min(1.0, msg_score))
 
-    return total_score / len(assistant_messages)
+    return total_score / len(assistant_turns)
 
 
 def get_detailed_conversation_metrics(conversation: List[Dict]) -> ConversationMetrics:
@@ -413,21 +517,24 @@ def get_detailed_conversation_metrics(conversation: List[Dict]) -> ConversationM
             avg_response_length=0.0
         )
 
-    assistant_messages = [
-        msg for msg in conversation
-        if msg.get("role") == "assistant"
-    ]
+    turns = _prepare(conversation)
+    assistant_turns = [t for t in turns if t.role == "assistant"]
 
-    relevance = _score_relevance(conversation)
-    helpfulness = _score_helpfulness(assistant_messages)
-    accuracy = _score_accuracy(assistant_messages)
-    naturalness = _score_naturalness(assistant_messages)
+    relevance = _score_relevance(turns)
+    helpfulness = _score_helpfulness(assistant_turns)
+    accuracy = _score_accuracy(assistant_turns)
+    naturalness = _score_naturalness(assistant_turns)
 
-    overall = calculate_conversation_score(conversation)
+    # Compose the overall score from the components already computed
+    # instead of re-running the scorers via calculate_conversation_score
+    if len(turns) >= 2 and assistant_turns:
+        overall = _compose_score(relevance, helpfulness, accuracy, naturalness)
+    else:
+        overall = 0.0
 
     avg_length = (
-        sum(len(msg.get("content", "").split()) for msg in assistant_messages) /
-        max(len(assistant_messages), 1)
+        sum(t.word_count for t in assistant_turns) /
+        max(len(assistant_turns), 1)
     )
 
     return ConversationMetrics(
@@ -436,11 +543,11 @@ def get_detailed_conversation_metrics(conversation: List[Dict]) -> ConversationM
         accuracy_score=accuracy,
         naturalness_score=naturalness,
         overall_score=overall,
-        total_turns=len(conversation),
+        total_turns=len(turns),
         avg_response_length=avg_length,
         details={
-            "user_turns": len([m for m in conversation if m.get("role") == "user"]),
-            "assistant_turns": len(assistant_messages)
+            "user_turns": len([t for t in turns if t.role == "user"]),
+            "assistant_turns": len(assistant_turns)
         }
     )
 
@@ -473,8 +580,8 @@ def track_tool_usage(tools_used: List[str]) -> Dict[str, Any]:
         "total_calls": len(tools_used),
         "unique_tools": len(frequency),
         "tool_frequency": dict(frequency),
-        "most_used": frequency.most_common(1)[0][0] if frequency else None,
-        "least_used": frequency.most_common()[-1][0] if frequency else None,
+        "most_used": max(frequency.items(), key=itemgetter(1))[0],
+        "least_used": min(frequency.items(), key=itemgetter(1))[0],
         "tool_sequence": tools_used
     }
 
@@ -526,8 +633,8 @@ def get_detailed_tool_metrics(
         tool_frequency=dict(frequency),
         tool_success_rate=success_rate,
         avg_tools_per_conversation=len(tools_used),
-        most_used_tool=frequency.most_common(1)[0][0],
-        least_used_tool=frequency.most_common()[-1][0],
+        most_used_tool=max(frequency.items(), key=itemgetter(1))[0],
+        least_used_tool=min(frequency.items(), key=itemgetter(1))[0],
         tool_sequence=tools_used,
         redundant_calls=redundant
     )
@@ -563,31 +670,61 @@ def get_detailed_latency_metrics(
     Returns:
         LatencyMetrics object
     """
-    response_times = []
-
-    # Calculate time between turns
-    for i in range(len(conversation) - 1):
-        t1 = conversation[i].get("timestamp", 0)
-        t2 = conversation[i + 1].get("timestamp", 0)
-        if t1 and t2:
-            response_times.append(t2 - t1)
-
-    if not response_times:
-        response_times = [total_duration]
-
-    # Sort for median calculation
-    sorted_times = sorted(response_times)
-    median_idx = len(sorted_times) // 2
-    median = sorted_times[median_idx] if sorted_times else 0.0
+    # Pull the timestamp column out once; the branches below then work on
+    # a flat list instead of re-fetching from each turn dict
+    timestamps = [turn.get("timestamp", 0) for turn in conversation]
+
+    # Long transcripts: compute the consecutive diffs and reductions with
+    # numpy instead of interpreter-level loops
+    if np is not None and len(timestamps) >= _NUMPY_LATENCY_MIN_TURNS:
+        ts = np.fromiter(timestamps, dtype=np.float64, count=len(timestamps))
+        diffs = np.diff(ts)
+        # Keep parity with the scalar path: both endpoints must be set
+        diffs = diffs[(ts[:-1] != 0) & (ts[1:] != 0)]
+        if diffs.size:
+            response_times = diffs.tolist()
+            avg = float(diffs.mean())
+            minimum = float(diffs.min())
+            maximum = float(diffs.max())
+            # Selection (O(n)) rather than a full sort just to read the
+            # upper-median element
+            mid = diffs.size // 2
+            median = float(np.partition(diffs, mid)[mid])
+        else:
+            response_times = [total_duration]
+            avg = minimum = maximum = median = total_duration
+    else:
+        response_times = []
+
+        # Calculate time between turns
+        for t1, t2 in zip(timestamps, timestamps[1:]):
+            if t1 and t2:
+                response_times.append(t2 - t1)
+
+        if not response_times:
+            response_times = [total_duration]
+
+        # One pass over the times for sum/min/max; median_high matches
+        # the upper-median the old sorted[len // 2] indexing returned
+        total = 0.0
+        minimum = maximum = response_times[0]
+        for t in response_times:
+            total += t
+            if t < minimum:
+                minimum = t
+            elif t > maximum:
+                maximum = t
+        avg = total / len(response_times)
+        median = statistics.median_high(response_times)
 
     # Estimate API calls (agent responses)
-    api_calls = len([m for m in conversation if m.get("role") == "assistant"])
+    api_calls = sum(1 for m in conversation if m.get("role") == "assistant")
 
     return LatencyMetrics(
         total_duration=total_duration,
-        avg_response_time=sum(response_times) / max(len(response_times), 1),
-        min_response_time=min(response_times) if response_times else 0.0,
-        max_response_time=max(response_times) if response_times else 0.0,
+        avg_response_time=avg,
+        min_response_time=minimum,
+        max_response_time=maximum,
         median_response_time=median,
         response_times=response_times,
         api_call_count=api_calls,
@@ -679,45 +816,49 @@ def evaluate_task_success(
     """
     results = {}
 
-    # Join all conversation content for analysis
+    # Join all conversation content for analysis — one lowercase pass
+    # over the concatenation rather than one per message — then collect
+    # every indicator hit in one linear scan; the per-criterion checks
+    # below become set lookups
     all_content = " ".join(
-        msg.get("content", "").lower()
+        msg.get("content", "")
         for msg in conversation
-    )
+    ).lower()
+    found = set(_TASK_INDICATOR_RE.findall(all_content))
 
     # Check appointment_booked
     if "appointment_booked" in success_criteria:
         booked_indicators = ["confirmed", "scheduled", "booked", "appointment set"]
         results["appointment_booked"] = any(
-            indicator in all_content for indicator in booked_indicators
+            indicator in found for indicator in booked_indicators
         ) and "book_appointment" in tools_called
 
     # Check correct_specialty_identified
     if "correct_specialty_identified" in success_criteria:
         specialty_indicators = ["orthopedic", "cardiology", "primary care"]
         results["correct_specialty_identified"] = any(
-            indicator in all_content for indicator in specialty_indicators
+            indicator in found for indicator in specialty_indicators
         )
 
     # Check insurance_verified
     if "insurance_verified" in success_criteria:
         results["insurance_verified"] = (
             "verify_insurance" in tools_called or
-            "insurance" in all_content
+            "insurance" in found
         )
 
     # Check referral_checked
     if "referral_checked" in success_criteria:
         results["referral_checked"] = (
             "check_referral" in tools_called or
-            "referral" in all_content
+            "referral" in found
         )
 
     # Check provider_matched_preferences
     if "provider_matched_preferences" in success_criteria:
         provider_indicators = ["dr.", "doctor", "provider"]
         results["provider_matched_preferences"] = (
-            any(indicator in all_content for indicator in provider_indicators) and
+            any(indicator in found for indicator in provider_indicators) and
             "check_provider" in tools_called
         )
 
@@ -725,7 +866,7 @@ def evaluate_task_success(
     if "appropriate_urgency" in success_criteria:
         urgency_indicators = ["urgent", "asap", "soon", "emergency", "priority"]
         results["appropriate_urgency"] = any(
-            indicator in all_content for indicator in urgency_indicators
+            indicator in found for indicator in urgency_indicators
         )
 
     # Check tools_used_correctly
@@ -893,10 +1034,41 @@ def generate_dashboard_data(results: List[Dict[str, Any]]) -> Dict[str, Any]:
         calculate_conversation_score(conv) for conv in all_conversations
     ]
 
+    durations = [r.get("duration_seconds", 0.0) for r in results]
+    token_estimates = [
+        r.get("metrics", {}).get("total_tokens_estimate", 0)
+        for r in results
+    ]
+
+    # Large result sets: run the numeric reductions through numpy instead
+    # of one interpreter loop per aggregate
+    if np is not None and total >= _NUMPY_AGG_MIN_RESULTS:
+        scores_arr = np.fromiter(conv_scores, dtype=np.float64, count=total)
+        durations_arr = np.fromiter(durations, dtype=np.float64, count=total)
+        tokens_arr = np.fromiter(token_estimates, dtype=np.float64, count=total)
+
+        score_avg = float(scores_arr.mean())
+        score_min = float(scores_arr.min())
+        score_max = float(scores_arr.max())
+        duration_sum = float(durations_arr.sum())
+        duration_avg = float(durations_arr.mean())
+        duration_min = float(durations_arr.min())
+        duration_max = float(durations_arr.max())
+        token_sum = float(tokens_arr.sum())
+    else:
+        score_avg = sum(conv_scores) / total
+        score_min = min(conv_scores)
+        score_max = max(conv_scores)
+        duration_sum = sum(durations)
+        duration_avg = duration_sum / total
+        duration_min = min(durations)
+        duration_max = max(durations)
+        token_sum = sum(token_estimates)
+
     conversation_metrics = {
-        "average_score": round(sum(conv_scores) / len(conv_scores), 3) if conv_scores else 0.0,
-        "min_score": round(min(conv_scores), 3) if conv_scores else 0.0,
-        "max_score": round(max(conv_scores), 3) if conv_scores else 0.0,
+        "average_score": round(score_avg, 3),
+        "min_score": round(score_min, 3),
+        "max_score": round(score_max, 3),
         "score_distribution": conv_scores
     }
 
@@ -908,23 +1080,18 @@ def generate_dashboard_data(results: List[Dict[str, Any]]) -> Dict[str, Any]:
     tool_metrics = track_tool_usage(all_tools)
 
     # Aggregate latency metrics
-    durations = [r.get("duration_seconds", 0.0) for r in results]
     latency_metrics = {
-        "avg_duration": round(sum(durations) / len(durations), 2) if durations else 0.0,
-        "min_duration": round(min(durations), 2) if durations else 0.0,
-        "max_duration": round(max(durations), 2) if durations else 0.0,
-        "total_duration": round(sum(durations), 2)
+        "avg_duration": round(duration_avg, 2),
+        "min_duration": round(duration_min, 2),
+        "max_duration": round(duration_max, 2),
+        "total_duration": round(duration_sum, 2)
     }
 
     # Aggregate token metrics
-    token_estimates = [
-        r.get("metrics", {}).get("total_tokens_estimate", 0)
-        for r in results
-    ]
     token_metrics = {
-        "total_tokens": int(sum(token_estimates)),
-        "avg_tokens_per_scenario": round(sum(token_estimates) / len(token_estimates), 1) if token_estimates else 0.0,
-        "estimated_cost": round(sum(token_estimates) / 1_000_000 * 0.15, 4)  # Rough estimate
+        "total_tokens": int(token_sum),
+        "avg_tokens_per_scenario": round(token_sum / total, 1),
+        "estimated_cost": round(token_sum / 1_000_000 * 0.15, 4)  # Rough estimate
     }
 
     # Agent performance comparison
@@ -964,8 +1131,12 @@ def export_dashboard_data(results: List[Dict[str, Any]], filepath: str) -> None:
     """Export dashboard metrics to JSON file."""
     dashboard_data = generate_dashboard_data(results)
 
-    with open(filepath, 'w') as f:
-        json.dump(dashboard_data, f, indent=2)
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(dashboard_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w') as f:
+            json.dump(dashboard_data, f, indent=2)
 
     print(f"\nDashboard data exported to: {filepath}")
 
@@ -5,15 +5,50 @@ Defines realistic patient scenarios to test multi-agent orchestration,
 RAG retrieval, function calling, and conversation quality.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime
 from typing import List, Dict, Optional, Callable, Any
+import asyncio
 import time
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements
+    orjson = None
+
 from mock_data import PATIENTS, get_patient_by_id
 
 
+class RunningStats:
+    """Incrementally maintained count/sum/min/max for a single metric.
+
+    Updated as results stream in, so summaries need no second pass over
+    the result list.
+    """
+    __slots__ = ("count", "total", "minimum", "maximum")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
 @dataclass
 class SuccessCriteria:
     """Defines success criteria for a test scenario."""
@@ -334,8 +369,9 @@ class ScenarioResult:
     warnings: List[str]
     metrics: Dict[str, Any]
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
+    @cached_property
+    def as_dict(self) -> Dict[str, Any]:
+        """Serialized form, computed once per result and reused."""
         return {
             "scenario_id": self.scenario_id,
             "scenario_name": self.scenario_name,
@@ -353,53 +389,47 @@ class ScenarioResult:
             "metrics": self.metrics,
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return self.as_dict
 
-def run_scenario(
-    scenario: TestScenario,
-    agent_function: Callable[[str, str], Dict[str, Any]],
-    verbose: bool = False
-) -> ScenarioResult:
-    """
-    Run a single test scenario against the agent system.
-
-    Args:
-        scenario: The test scenario to run
-        agent_function: Callable that takes (patient_id, message) and returns agent response
-        verbose: Whether to print detailed progress
 
-    Returns:
-        ScenarioResult with detailed evaluation data
-    """
-    if verbose:
-        print(f"\n{'='*80}")
-        print(f"Running Scenario: {scenario.name}")
-        print(f"Patient: {scenario.get_patient()}")
-        print(f"Expected Specialty: {scenario.expected_specialty}")
-        print(f"{'='*80}\n")
+class _ScenarioRun:
+    """Mutable state for one scenario execution, shared by the sync and
+    async runners."""
 
-    start_time = time.time()
-    conversation_history = []
-    tools_called = []
-    agents_used = []
-    errors = []
-    warnings = []
+    __slots__ = (
+        "scenario", "verbose", "start_time", "conversation_history",
+        "tools_called", "agents_used", "errors", "warnings",
+    )
 
-    try:
-        # Initialize conversation with patient's initial message
-        conversation_history.append({
+    def __init__(self, scenario: TestScenario, verbose: bool):
+        if verbose:
+            print(f"\n{'='*80}")
+            print(f"Running Scenario: {scenario.name}")
+            print(f"Patient: {scenario.get_patient()}")
+            print(f"Expected Specialty: {scenario.expected_specialty}")
+            print(f"{'='*80}\n")
+
+        self.scenario = scenario
+        self.verbose = verbose
+        self.start_time = time.time()
+        self.conversation_history = [{
             "role": "user",
             "content": scenario.initial_message,
             "timestamp": time.time()
-        })
+        }]
+        self.tools_called = []
+        self.agents_used = []
+        self.errors = []
+        self.warnings = []
 
         if verbose:
             print(f"User: {scenario.initial_message}\n")
 
-        # Call agent function
-        response = agent_function(scenario.patient_id, scenario.initial_message)
-
-        # Record agent response
-        conversation_history.append({
+    def record_response(self, response: Dict[str, Any]) -> None:
+        """Record an agent response turn."""
+        self.conversation_history.append({
             "role": "assistant",
             "content": response.get("message", ""),
             "agent": response.get("agent", "unknown"),
@@ -407,24 +437,89 @@ def run_scenario(
             "timestamp": time.time()
         })
 
-        if verbose:
+        if self.verbose:
             print(f"Agent ({response.get('agent', 'unknown')}): {response.get('message', '')}\n")
 
         # Track tools and agents
         if "tools_used" in response:
-            tools_called.extend(response["tools_used"])
+            self.tools_called.extend(response["tools_used"])
         if "agent" in response:
-            agents_used.append(response["agent"])
+            self.agents_used.append(response["agent"])
 
         # Record any errors
         if "error" in response:
-            errors.append(response["error"])
+            self.errors.append(response["error"])
 
-    except Exception as e:
-        errors.append(f"Exception during scenario execution: {str(e)}")
-        if verbose:
+    def record_exception(self, e: Exception) -> None:
+        """Record an exception raised during scenario execution."""
+        self.errors.append(f"Exception during scenario execution: {str(e)}")
+        if self.verbose:
             print(f"ERROR: {str(e)}\n")
 
+
+def run_scenario(
+    scenario: TestScenario,
+    agent_function: Callable[[str, str], Dict[str, Any]],
+    verbose: bool = False
+) -> ScenarioResult:
+    """
+    Run a single test scenario against the agent system.
+
+    Args:
+        scenario: The test scenario to run
+        agent_function: Callable that takes (patient_id, message) and returns agent response
+        verbose: Whether to print detailed progress
+
+    Returns:
+        ScenarioResult with detailed evaluation data
+    """
+    run = _ScenarioRun(scenario, verbose)
+    try:
+        run.record_response(
+            agent_function(scenario.patient_id, scenario.initial_message)
+        )
+    except Exception as e:
+        run.record_exception(e)
+    return _finalize_scenario_result(run)
+
+
+async def run_scenario_async(
+    scenario: TestScenario,
+    agent_function: Callable[[str, str], Any],
+    verbose: bool = False
+) -> ScenarioResult:
+    """
+    Async counterpart of run_scenario.
+
+    agent_function may be a coroutine function (awaited directly, so an
+    async agent gets true concurrency) or a plain callable (run in a
+    worker thread).
+    """
+    run = _ScenarioRun(scenario, verbose)
+    try:
+        if asyncio.iscoroutinefunction(agent_function):
+            response = await agent_function(scenario.patient_id, scenario.initial_message)
+        else:
+            response = await asyncio.to_thread(
+                agent_function, scenario.patient_id, scenario.initial_message
+            )
+        run.record_response(response)
+    except Exception as e:
+        run.record_exception(e)
+    return _finalize_scenario_result(run)
+
+
+def _finalize_scenario_result(run: "_ScenarioRun") -> ScenarioResult:
+    """Evaluate a completed run and build its ScenarioResult."""
+    scenario = run.scenario
+    verbose = run.verbose
+    start_time = run.start_time
+    conversation_history = run.conversation_history
+    tools_called = run.tools_called
+    agents_used = run.agents_used
+    errors = run.errors
+    warnings = run.warnings
+
     end_time = time.time()
     duration = end_time - start_time
 
@@ -494,33 +589,85 @@ def run_scenario(
 def run_all_scenarios(
     agent_function: Callable[[str, str], Dict[str, Any]],
     scenarios: Optional[List[TestScenario]] = None,
-    verbose: bool = False
+    verbose: bool = False,
+    max_workers: Optional[int] = None
 ) -> List[ScenarioResult]:
     """
-    Run all test scenarios and collect results.
+    Run all test scenarios concurrently and collect results.
+
+    The agent under test is I/O-bound (LLM and tool calls), so scenarios
+    fan out on a thread pool and the wall clock approaches the slowest
+    scenario instead of the sum. Results keep the input order.
 
     Args:
         agent_function: Callable that takes (patient_id, message) and returns agent response
         scenarios: List of scenarios to run (defaults to ALL_SCENARIOS)
         verbose: Whether to print detailed progress
+        max_workers: Thread pool size (defaults to min(32, len(scenarios)))
 
     Returns:
         List of ScenarioResult objects
     """
     if scenarios is None:
         scenarios = ALL_SCENARIOS
+    if max_workers is None:
+        max_workers = min(32, len(scenarios)) or 1
 
-    results = []
+    print(f"\n{'#'*80}")
+    print(f"# RUNNING {len(scenarios)} TEST SCENARIOS")
+    print(f"{'#'*80}\n")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(
+            lambda scenario: run_scenario(scenario, agent_function, verbose=verbose),
+            scenarios
+        ))
+
+    _print_batch_summary(scenarios, results)
+    return results
+
+
+async def run_all_scenarios_async(
+    agent_function: Callable[[str, str], Any],
+    scenarios: Optional[List[TestScenario]] = None,
+    verbose: bool = False
+) -> List[ScenarioResult]:
+    """
+    Async counterpart of run_all_scenarios.
+
+    Scenarios run concurrently via asyncio.gather; pass a coroutine agent
+    function to get event-loop concurrency with no thread pool. Results
+    keep the input order.
+    """
+    if scenarios is None:
+        scenarios = ALL_SCENARIOS
 
     print(f"\n{'#'*80}")
     print(f"# RUNNING {len(scenarios)} TEST SCENARIOS")
     print(f"{'#'*80}\n")
 
-    for i, scenario in enumerate(scenarios, 1):
-        print(f"\n[{i}/{len(scenarios)}] Starting: {scenario.name}")
-        result = run_scenario(scenario, agent_function, verbose=verbose)
-        results.append(result)
+    results = list(await asyncio.gather(*[
+        run_scenario_async(scenario, agent_function, verbose=verbose)
+        for scenario in scenarios
+    ]))
+
+    _print_batch_summary(scenarios, results)
+    return results
+
 
+def _print_batch_summary(
+    scenarios: List[TestScenario],
+    results: List[ScenarioResult]
+) -> None:
+    """Print per-scenario statuses and the aggregate summary."""
+    # Accumulate summary stats while printing statuses - no extra pass
+    passed = 0
+    duration_stats = RunningStats()
+    score_stats = RunningStats()
+    for i, (scenario, result) in enumerate(zip(scenarios, results), 1):
+        passed += result.success_achieved
+        duration_stats.add(result.duration_seconds)
+        score_stats.add(result.metrics["conversation_score"])
         status = " PASS" if result.success_achieved else " FAIL"
         print(f"[{i}/{len(scenarios)}] {status}: {scenario.name} ({result.duration_seconds:.2f}s)")
 
@@ -530,20 +677,14 @@ def run_all_scenarios(
     print(f"{'#'*80}")
 
     total = len(results)
-    passed = sum(1 for r in results if r.success_achieved)
     failed = total - passed
 
     print(f"\nTotal Scenarios: {total}")
     print(f"Passed: {passed} ({passed/total*100:.1f}%)")
     print(f"Failed: {failed} ({failed/total*100:.1f}%)")
 
-    avg_duration = sum(r.duration_seconds for r in results) / total
-    avg_score = sum(r.metrics["conversation_score"] for r in results) / total
-
-    print(f"\nAverage Duration: {avg_duration:.2f}s")
-    print(f"Average Conversation Score: {avg_score:.2f}")
-
-    return results
+    print(f"\nAverage Duration: {duration_stats.mean:.2f}s")
+    print(f"Average Conversation Score: {score_stats.mean:.2f}")
 
 
 def get_scenario_by_id(scenario_id: str) -> Optional[TestScenario]:
@@ -566,16 +707,23 @@ def get_scenarios_by_difficulty(difficulty: str) -> List[TestScenario]:
 
 def export_results_to_json(results: List[ScenarioResult], filepath: str) -> None:
     """Export scenario results to JSON file."""
+    passed = sum(1 for r in results if r.success_achieved)
     data = {
         "timestamp": datetime.now().isoformat(),
         "total_scenarios": len(results),
-        "passed": sum(1 for r in results if r.success_achieved),
-        "failed": sum(1 for r in results if not r.success_achieved),
-        "results": [r.to_dict() for r in results]
+        "passed": passed,
+        "failed": len(results) - passed,
+        "results": [r.as_dict for r in results]
     }
 
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=2)
+    # orjson serializes straight to bytes, skipping the large intermediate
+    # str that json.dump builds for nested conversation logs
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w') as f:
+            json.dump(data, f, indent=2)
 
     print(f"\nResults exported to: {filepath}")
 
@@ -7,6 +7,8 @@ Uses ChromaDB for vector storage and semantic search.
 """
 
 import os
+import functools
+import threading
 from typing import List, Dict, Any, Optional
 import chromadb
 from chromadb.config import Settings
@@ -992,18 +994,25 @@ class HealthcarePolicyRAG:
 
 # Global RAG instance
 _rag_instance = None
+_rag_lock = threading.Lock()
 
 def get_rag_instance() -> HealthcarePolicyRAG:
     """
     Get or create the global RAG instance (singleton pattern).
 
+    Thread-safe: concurrent first callers (e.g. a background prewarm
+    racing the main thread) initialize exactly one instance.
+
     Returns:
         Initialized HealthcarePolicyRAG instance
     """
     global _rag_instance
     if _rag_instance is None:
-        _rag_instance = HealthcarePolicyRAG()
-        _rag_instance.initialize()
+        with _rag_lock:
+            if _rag_instance is None:
+                instance = HealthcarePolicyRAG()
+                instance.initialize()
+                _rag_instance = instance
     return _rag_instance
 
 
@@ -1022,6 +1031,34 @@ def retrieve_policies(query: str, n_results: int = 3) -> List[Dict[str, Any]]:
     return rag.retrieve_policies(query, n_results)
 
 
+@functools.lru_cache(maxsize=1024)
+def _retrieve_policies_memo(normalized_query: str, n_results: int) -> tuple:
+    """LRU-cached retrieval body; tuple return keeps the cache entries hashable-safe."""
+    rag = get_rag_instance()
+    return tuple(rag.retrieve_policies(normalized_query, n_results))
+
+
+def retrieve_policies_cached(query: str, n_results: int = 3) -> List[Dict[str, Any]]:
+    """
+    Memoized variant of retrieve_policies keyed on the normalized query.
+
+    Agent queries repeat heavily (fixed specialty prefix plus small message
+    variation), and each retrieval pays an embedding plus a vector search.
+    Whitespace and case are collapsed so trivially different phrasings share
+    a slot. Callers must treat the returned policies as read-only - the
+    dicts are shared across cache hits.
+
+    Args:
+        query: Search query
+        n_results: Number of results to return
+
+    Returns:
+        List of relevant policy documents with metadata
+    """
+    normalized = " ".join(query.lower().split())
+    return list(_retrieve_policies_memo(normalized, n_results))
+
+
 def initialize_rag() -> HealthcarePolicyRAG:
     """
     Initialize the RAG system and return the instance.
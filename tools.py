@@ -1131,6 +1131,25 @@ TOOLS_DEFINITIONS = [
     }
 ]
 
+# Freeze the schemas: the OpenAI SDK serializes `tools=` on every request
+# and the resulting bytes participate in the server-side prompt-cache key,
+# so the structure must stay byte-identical across calls. The tuple blocks
+# accidental appends; TOOLS_DEFINITIONS_JSON is the canonical serialization
+# for anything that needs the raw bytes (cache keys, logging, diffing).
+TOOLS_DEFINITIONS = tuple(TOOLS_DEFINITIONS)
+try:
+    import orjson
+    TOOLS_DEFINITIONS_JSON = orjson.dumps(
+        TOOLS_DEFINITIONS, option=orjson.OPT_SORT_KEYS
+    )
+except ImportError:
+    TOOLS_DEFINITIONS_JSON = json.dumps(
+        TOOLS_DEFINITIONS, sort_keys=True, separators=(",", ":")
+    ).encode("utf-8")
+
+# Aliases matching the names the agent modules import
+TOOL_DEFINITIONS = TOOLS_DEFINITIONS
+
 
 # ============================================================================
 # TOOL DISPATCHER
@@ -1183,6 +1202,10 @@ def execute_tool(tool_name: str, tool_arguments: Dict[str, Any]) -> Dict[str, An
         }
 
 
+# Alias matching the name the agent modules import
+execute_tool_call = execute_tool
+
+
 if __name__ == "__main__":
     """Test the tools with sample calls."""
     print("BSW Scheduling Agent - Tools Test\n")